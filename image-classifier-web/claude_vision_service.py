@@ -17,6 +17,7 @@ from typing import List, Dict, Any, Optional
 import json
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Make anthropic import optional
 try:
@@ -43,7 +44,9 @@ try:
     )
     from prompts import (
         get_layer2_prompt,
-        build_layer2_message,
+        get_layer2_instructions,
+        build_layer2_context,
+        LAYER2_VALIDATE,
         build_layer4_prompt,
         parse_layer4_response,
         merge_verification_with_evaluation
@@ -66,16 +69,22 @@ class ClaudeVisionService:
     Service for analyzing parking violation evidence images using Claude Vision.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Beta header enabling prompt caching on older API/SDK versions
+    PROMPT_CACHE_BETA = "prompt-caching-2024-07-31"
+
+    def __init__(self, api_key: Optional[str] = None, enable_prompt_cache: bool = False):
         """
         Initialize the Claude Vision service.
 
         Args:
             api_key: Anthropic API key. If None, reads from ANTHROPIC_API_KEY env var.
+            enable_prompt_cache: Mark the static system prompt as cacheable so
+                repeated calls reuse it instead of reprocessing it
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.client = None
         self.model = "claude-sonnet-4-20250514"
+        self.enable_prompt_cache = enable_prompt_cache
 
         if not ANTHROPIC_AVAILABLE:
             logger.warning("Anthropic package not installed - MLLM analysis will not be available")
@@ -83,7 +92,10 @@ class ClaudeVisionService:
 
         if self.api_key:
             try:
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                default_headers = (
+                    {"anthropic-beta": self.PROMPT_CACHE_BETA} if enable_prompt_cache else None
+                )
+                self.client = anthropic.Anthropic(api_key=self.api_key, default_headers=default_headers)
                 logger.info("ClaudeVisionService initialized with API key")
             except Exception as e:
                 logger.warning(f"Failed to initialize Anthropic client: {e}")
@@ -94,6 +106,53 @@ class ClaudeVisionService:
         """Check if the service is available (API key configured)."""
         return self.client is not None
 
+    def warm_up(self) -> bool:
+        """
+        Send a minimal 1-token request so the connection is established
+        before the first real analysis.
+
+        Returns:
+            True if the request succeeded
+        """
+        if not self.client:
+            return False
+        try:
+            self.client.messages.create(
+                model=self.model,
+                max_tokens=1,
+                messages=[{"role": "user", "content": "ping"}]
+            )
+            logger.info("ClaudeVisionService warm-up request completed")
+            return True
+        except Exception as e:
+            logger.warning(f"ClaudeVisionService warm-up failed: {e}")
+            return False
+
+    def _system_prompt(self, text: str):
+        """
+        Wrap a static system prompt for messages.create.
+
+        Args:
+            text: System prompt text (identical across requests)
+
+        Returns:
+            The plain string, or a single text block marked with an ephemeral
+            cache_control breakpoint when prompt caching is enabled
+        """
+        if not self.enable_prompt_cache:
+            return text
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+    def _log_cache_usage(self, response, tag: str) -> None:
+        """Log prompt-cache reads/writes reported in the response usage."""
+        if not self.enable_prompt_cache:
+            return
+        usage = getattr(response, "usage", None)
+        logger.info(
+            f"{tag} Prompt cache: read={getattr(usage, 'cache_read_input_tokens', None)}, "
+            f"created={getattr(usage, 'cache_creation_input_tokens', None)}"
+        )
+
     def _encode_image(self, image_path: str) -> tuple[str, str]:
         """
         Encode image to base64 and determine media type.
@@ -119,6 +178,43 @@ class ClaudeVisionService:
 
         return image_data, media_type
 
+    def _build_image_blocks(self, image_paths: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Read and base64-encode images concurrently into message content blocks.
+
+        Args:
+            image_paths: Paths of the images to send
+            max_workers: Maximum number of images read at once
+
+        Returns:
+            Image content blocks in input order; images that cannot be read
+            are logged and skipped
+        """
+        def encode(img_path):
+            try:
+                return self._encode_image(img_path)
+            except Exception as e:
+                logger.warning(f"Could not encode image {img_path}: {e}")
+                return None
+
+        if len(image_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as executor:
+                encoded = list(executor.map(encode, image_paths))
+        else:
+            encoded = [encode(img_path) for img_path in image_paths]
+
+        return [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": img_data
+                }
+            }
+            for img_data, media_type in filter(None, encoded)
+        ]
+
     def _select_best_images(
         self,
         image_paths: List[str],
@@ -383,25 +479,8 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
         selected_images = self._select_best_images(image_paths, max_images)
         logger.info(f"Selected {len(selected_images)} images for MLLM analysis")
 
-        # Build message content with images
-        content = []
-
-        # Add images first
-        for img_path in selected_images:
-            try:
-                img_data, media_type = self._encode_image(img_path)
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": img_data
-                    }
-                })
-                logger.debug(f"Encoded image: {img_path}")
-            except Exception as e:
-                logger.warning(f"Could not encode image {img_path}: {e}")
-                continue
+        # Build message content with images first
+        content = self._build_image_blocks(selected_images)
 
         if not content:
             return {
@@ -664,22 +743,7 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
         logger.info(f"[Layer 2] Selected {len(selected_images)} images for objective analysis")
 
         # Build message content with images
-        content = []
-
-        for img_path in selected_images:
-            try:
-                img_data, media_type = self._encode_image(img_path)
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": img_data
-                    }
-                })
-            except Exception as e:
-                logger.warning(f"Could not encode image {img_path}: {e}")
-                continue
+        content = self._build_image_blocks(selected_images)
 
         if not content:
             return {
@@ -694,8 +758,11 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
             "license_plate": vehicle_info.get("kenteken"),
             "location": f"{location_info.get('straat', '')}, {location_info.get('buurt', '')}",
         }
-        prompt = build_layer2_message(lang, document_context)
-        content.append({"type": "text", "text": prompt})
+        # Only the per-case context follows the images; the static
+        # instructions are sent as the (cacheable) system prompt
+        context = build_layer2_context(document_context).lstrip()
+        if context:
+            content.append({"type": "text", "text": context})
 
         # Call Claude Vision API
         try:
@@ -703,8 +770,10 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=2000,
+                system=self._system_prompt(get_layer2_instructions(lang)),
                 messages=[{"role": "user", "content": content}]
             )
+            self._log_cache_usage(response, "[Layer 2]")
 
             response_text = response.content[0].text
             logger.debug(f"[Layer 2] Raw response: {response_text[:500]}...")
@@ -717,6 +786,10 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
                 json_str = json_str.split("```")[1].split("```")[0]
 
             layer2_output = json.loads(json_str.strip())
+            # Output that does not match the Layer 2 schema is reported like
+            # any other failed call (only when fastjsonschema is installed)
+            if LAYER2_VALIDATE is not None:
+                LAYER2_VALIDATE(layer2_output)
 
             # Add metadata
             layer2_output["_metadata"] = {
@@ -1287,7 +1360,8 @@ def analyze_parking_evidence(
     doc_summary: Dict[str, Any],
     lang: str = 'nl',
     max_images: int = 10,
-    use_v2_pipeline: bool = None
+    use_v2_pipeline: bool = None,
+    service: Optional[ClaudeVisionService] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze parking violation evidence.
@@ -1299,6 +1373,8 @@ def analyze_parking_evidence(
         max_images: Maximum images to analyze
         use_v2_pipeline: Whether to use Legal Reasoning v2 pipeline.
                         If None, uses USE_LEGAL_PIPELINE_V2 flag.
+        service: Existing ClaudeVisionService to reuse (keeps its client and
+                 prompt-cache setting). If None, a new one is created.
 
     Returns:
         Formatted results for UI
@@ -1315,7 +1391,8 @@ def analyze_parking_evidence(
             }
         }
 
-    service = ClaudeVisionService()
+    if service is None:
+        service = ClaudeVisionService()
 
     if not service.is_available():
         return {
@@ -1368,7 +1445,8 @@ def analyze_parking_evidence_v2(
     image_paths: List[str],
     doc_summary: Dict[str, Any],
     lang: str = 'nl',
-    max_images: int = 10
+    max_images: int = 10,
+    service: Optional[ClaudeVisionService] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze parking violation evidence using v2 pipeline.
@@ -1381,6 +1459,8 @@ def analyze_parking_evidence_v2(
         doc_summary: Document summary from PDF extraction
         lang: Language code
         max_images: Maximum images to analyze
+        service: Existing ClaudeVisionService to reuse. If None, a new one
+                 is created.
 
     Returns:
         Full pipeline result (not formatted for legacy UI)
@@ -1397,7 +1477,8 @@ def analyze_parking_evidence_v2(
             "error": "Legal Reasoning v2 modules not available"
         }
 
-    service = ClaudeVisionService()
+    if service is None:
+        service = ClaudeVisionService()
 
     if not service.is_available():
         return {
@@ -12,6 +12,7 @@ Usage:
 import argparse
 import json
 import io
+import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -30,6 +31,10 @@ except ImportError:
     sys.exit(1)
 
 
+# Characters other than letters, digits, '_' and '-' (same set as str.isalnum)
+_UNSAFE_STEM_RE = re.compile(r"[^\w-]")
+
+
 class ImageMetadata(TypedDict):
     """Metadata for an extracted image."""
     file: str
@@ -65,6 +70,19 @@ def get_unique_filename(path: Path) -> Path:
         version += 1
 
 
+def sanitize_stem(stem: str) -> str:
+    """
+    Replace characters that might cause issues in output filenames with "_".
+
+    Args:
+        stem: PDF filename stem
+
+    Returns:
+        The stem with only letters, digits, "_" and "-" left
+    """
+    return _UNSAFE_STEM_RE.sub("_", stem)
+
+
 def extract_embedded_images(
     doc: fitz.Document,
     page_num: int,
@@ -93,7 +111,12 @@ def extract_embedded_images(
     image_list = page.get_images(full=True)
 
     for img_index, img_info in enumerate(image_list):
-        xref = img_info[0]
+        # (xref, smask, width, height, ...): the image dictionary already
+        # gives the size, so small icons are skipped without decoding them
+        xref, _, width, height = img_info[:4]
+        if width < min_size or height < min_size:
+            filtered_count += 1
+            continue
 
         try:
             # Extract image data
@@ -260,9 +283,7 @@ def main() -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Get PDF stem for naming
-    pdf_stem = pdf_path.stem
-    # Sanitize stem (remove special chars that might cause issues)
-    pdf_stem = "".join(c if c.isalnum() or c in "-_" else "_" for c in pdf_stem)
+    pdf_stem = sanitize_stem(pdf_path.stem)
 
     print(f"Processing: {pdf_path.name}")
     print(f"Output directory: {out_dir.resolve()}")
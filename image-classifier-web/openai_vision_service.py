@@ -44,7 +44,9 @@ try:
     )
     from prompts import (
         get_layer2_prompt,
+        get_layer2_system_message,
         build_layer2_message,
+        LAYER2_VALIDATE,
         build_layer4_prompt,
         parse_layer4_response,
         merge_verification_with_evaluation
@@ -699,7 +701,10 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
             response = self.client.chat.completions.create(
                 model=self.model,
                 max_tokens=2000,
-                messages=[{"role": "user", "content": content}]
+                messages=[
+                    {"role": "system", "content": get_layer2_system_message(lang)},
+                    {"role": "user", "content": content}
+                ]
             )
 
             response_text = response.choices[0].message.content
@@ -713,6 +718,10 @@ Antwoord ALLEEN met valid JSON in dit exacte format (geen andere tekst). ALLE TE
                 json_str = json_str.split("```")[1].split("```")[0]
 
             layer2_output = json.loads(json_str.strip())
+            # Output that does not match the Layer 2 schema is reported like
+            # any other failed call (only when fastjsonschema is installed)
+            if LAYER2_VALIDATE is not None:
+                LAYER2_VALIDATE(layer2_output)
 
             # Add metadata
             layer2_output["_metadata"] = {
@@ -1281,7 +1290,8 @@ def analyze_parking_evidence_openai(
     doc_summary: Dict[str, Any],
     lang: str = 'nl',
     max_images: int = 10,
-    use_v2_pipeline: bool = None
+    use_v2_pipeline: bool = None,
+    service: Optional[OpenAIVisionService] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze parking violation evidence using OpenAI GPT-4o.
@@ -1293,6 +1303,8 @@ def analyze_parking_evidence_openai(
         max_images: Maximum images to analyze
         use_v2_pipeline: Whether to use Legal Reasoning v2 pipeline.
                         If None, uses USE_LEGAL_PIPELINE_V2 flag.
+        service: Existing OpenAIVisionService to reuse (keeps its client and
+                 connection pool). If None, a new one is created.
 
     Returns:
         Formatted results for UI
@@ -1309,7 +1321,8 @@ def analyze_parking_evidence_openai(
             }
         }
 
-    service = OpenAIVisionService()
+    if service is None:
+        service = OpenAIVisionService()
 
     if not service.is_available():
         return {
@@ -1362,7 +1375,8 @@ def analyze_parking_evidence_openai_v2(
     image_paths: List[str],
     doc_summary: Dict[str, Any],
     lang: str = 'nl',
-    max_images: int = 10
+    max_images: int = 10,
+    service: Optional[OpenAIVisionService] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze parking violation evidence using v2 pipeline with OpenAI.
@@ -1375,6 +1389,8 @@ def analyze_parking_evidence_openai_v2(
         doc_summary: Document summary from PDF extraction
         lang: Language code
         max_images: Maximum images to analyze
+        service: Existing OpenAIVisionService to reuse. If None, a new one
+                 is created.
 
     Returns:
         Full pipeline result (not formatted for legacy UI)
@@ -1391,7 +1407,8 @@ def analyze_parking_evidence_openai_v2(
             "error": "Legal Reasoning v2 modules not available"
         }
 
-    service = OpenAIVisionService()
+    if service is None:
+        service = OpenAIVisionService()
 
     if not service.is_available():
         return {
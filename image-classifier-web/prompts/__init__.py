@@ -15,8 +15,14 @@ Version: 2.0
 from .layer2_objective import (
     LAYER2_PROMPT_EN,
     LAYER2_PROMPT_NL,
+    LAYER2_SYSTEM_MESSAGE_EN,
+    LAYER2_SYSTEM_MESSAGE_NL,
     LAYER2_OUTPUT_SCHEMA,
+    LAYER2_VALIDATE,
     get_layer2_prompt,
+    get_layer2_system_message,
+    get_layer2_instructions,
+    build_layer2_context,
     build_layer2_message
 )
 
@@ -24,8 +30,11 @@ from .layer2_objective import (
 from .layer4_verification import (
     LAYER4_PROMPT_EN,
     LAYER4_PROMPT_NL,
+    LAYER4_SYSTEM_MESSAGE_EN,
+    LAYER4_SYSTEM_MESSAGE_NL,
     LAYER4_OUTPUT_SCHEMA,
     get_layer4_prompt,
+    get_layer4_system_message,
     build_layer4_prompt,
     parse_layer4_response,
     calculate_observation_match_score,
@@ -39,15 +48,24 @@ __all__ = [
     # Layer 2
     "LAYER2_PROMPT_EN",
     "LAYER2_PROMPT_NL",
+    "LAYER2_SYSTEM_MESSAGE_EN",
+    "LAYER2_SYSTEM_MESSAGE_NL",
     "LAYER2_OUTPUT_SCHEMA",
+    "LAYER2_VALIDATE",
     "get_layer2_prompt",
+    "get_layer2_system_message",
+    "get_layer2_instructions",
+    "build_layer2_context",
     "build_layer2_message",
 
     # Layer 4
     "LAYER4_PROMPT_EN",
     "LAYER4_PROMPT_NL",
+    "LAYER4_SYSTEM_MESSAGE_EN",
+    "LAYER4_SYSTEM_MESSAGE_NL",
     "LAYER4_OUTPUT_SCHEMA",
     "get_layer4_prompt",
+    "get_layer4_system_message",
     "build_layer4_prompt",
     "parse_layer4_response",
     "calculate_observation_match_score",
@@ -18,61 +18,96 @@ DO NOT provide legal interpretations or conclusions.
 
 Analyze the image(s) and report:
 
-1. VEHICLE OBSERVATION:
-   - Vehicle type (passenger car, van, truck, motorcycle, etc.)
-   - Color
-   - License plate (if visible, transcribe exactly)
-   - Position on the road/parking area
-
-2. TRAFFIC SIGN OBSERVATION:
-   ⚠️ CRITICAL DISTINCTION - READ CAREFULLY:
-   - E6 (Disabled parking) = Blue sign with WHITE WHEELCHAIR SYMBOL (♿) - MUST have wheelchair icon
-   - E9 (Permit holders) = Blue "P" sign with text "vergunninghouders" - NO wheelchair symbol, just text
-
-   🚨 IMPORTANT: If the sign shows "vergunninghouders" text WITHOUT a wheelchair symbol, it is E9, NOT E6!
-   🚨 Only classify as E6 if you see an actual wheelchair icon (♿) on the sign!
-
-   Full identification guide (Dutch E-series parking signs):
-     * E1 = No Parking: Round blue sign with red border and single red diagonal stripe (parkeerverbod)
-     * E2 = No Stopping: Round blue sign with red X cross (stilstaan verboden)
-     * E3 = No Bicycle/Moped Parking: Blue sign with bicycle and red diagonal stripe
-     * E4 = Parking Facility: Blue rectangular "P" sign without permit text - may have conditions on sub-sign
-     * E5 = Taxi Stand: Blue rectangular sign with "TAXI" text
-     * E6 = Disabled parking: MUST have WHITE WHEELCHAIR SYMBOL (♿)
-     * E7 = Loading/unloading zone: Blue sign with truck/cargo symbol
-     * E8 = Designated Vehicles: Blue "P" sign with specific vehicle type on sub-sign
-     * E9 = Permit holders parking: Blue "P" sign with text "vergunninghouders" (NO wheelchair!)
-     * E10 = Parking Disc Zone: Blue rectangular sign with parking disc symbol
-     * G7 = Pedestrian area/footpath: Blue sign with pedestrian symbol
-     * E4_ELECTRIC = EV Charging: Blue "P" sign with electric plug/charging symbol
-   - Is a sub-sign present? If so, what does it say?
-   - Approximate distance from vehicle to sign
-
-3. WINDSHIELD OBSERVATION:
-   - Is anything visible behind the windshield?
-   - Disability parking card: YES / NO / NOT VISIBLE
-   - Permit/exemption document: YES / NO / NOT VISIBLE
-   - Parking disc: YES / NO / NOT VISIBLE
-
-4. ROAD MARKINGS OBSERVATION:
-   - Yellow continuous line (gele doorgetrokken streep): YES / NO
-   - Yellow dashed line: YES / NO
-   - White parking lines: YES / NO
-   - Other road markings: describe if present
-   - Is vehicle parked alongside/touching yellow line: YES / NO
-
-5. ENVIRONMENT OBSERVATION:
-   - Driver present in or near vehicle: YES / NO
-   - Loading/unloading activity visible: YES / NO
-   - Other people near vehicle: YES / NO
-   - Is vehicle connected to charging point (if applicable): YES / NO / NOT APPLICABLE
-
-6. IMAGE QUALITY:
-   - Lighting conditions: day / night / artificial
-   - Image quality: good / moderate / poor
-   - License plate readability: full / partial / none
-
-OUTPUT FORMAT: JSON (valid JSON only, no markdown code blocks)
+1. VEHICLE: type, color, license plate (transcribe exactly if visible), position on road/parking area.
+
+2. TRAFFIC SIGN (Dutch parking signs, code = appearance):
+   E1 = round, red border, one red diagonal stripe (parkeerverbod)
+   E2 = round, red X (stilstaan verboden)
+   E3 = bicycle with red diagonal stripe
+   E4 = blue "P", no permit text (conditions may be on sub-sign)
+   E4_ELECTRIC = blue "P" with plug/charging symbol
+   E5 = "TAXI"
+   E6 = WHITE WHEELCHAIR SYMBOL - required
+   E7 = truck/cargo symbol (loading/unloading)
+   E8 = blue "P", vehicle type on sub-sign
+   E9 = blue "P" with text "vergunninghouders", NO wheelchair
+   E10 = parking disc symbol
+   G7 = pedestrian symbol
+   !! "vergunninghouders" without a wheelchair icon is E9, NOT E6. Only use E6 if you see the wheelchair icon.
+   Also report sub-sign text and approximate distance from vehicle to sign.
+
+3. WINDSHIELD: disability parking card, permit/exemption document, parking disc.
+
+4. ROAD MARKINGS: yellow continuous line (gele doorgetrokken streep), yellow dashed line, white parking lines, other markings, vehicle alongside/touching yellow line.
+
+5. ENVIRONMENT: driver present in/near vehicle, loading/unloading activity, other people near vehicle, vehicle connected to charging point (if applicable).
+
+6. IMAGE QUALITY: lighting (day / night / artificial), quality (good / moderate / poor), plate readability (full / partial / none).
+
+OUTPUT FORMAT: valid JSON only (no markdown code blocks), using the structure from the system message.
+
+RULES:
+- Report ONLY observable facts; make no assumptions about what is not visible
+- NO legal interpretations; do not use words like "violation", "illegal", "permitted", "prohibited"
+- Confidence reflects visual certainty, not legal certainty
+
+WINDSHIELD ITEMS (yes / no / not_visible):
+- "yes" = document clearly visible
+- "no" = any part of the windshield interior or dashboard is visible and the document is absent (glare does not count as obscured)
+- "not_visible" = ONLY when the interior is completely unobservable (100% reflection, fully fogged, or not in frame)
+When in doubt, use "no"; in ~95% of parking photos that is the correct answer for missing documents.
+"""
+
+
+LAYER2_PROMPT_NL = """Je bent een objectieve beeldanalist. Beschrijf ALLEEN wat je ziet.
+Geef GEEN juridische interpretaties of conclusies.
+
+Analyseer de afbeelding(en) en rapporteer:
+
+1. VOERTUIG: type, kleur, kenteken (exact overnemen indien zichtbaar), positie op de weg/parkeerplaats.
+
+2. VERKEERSBORD (Nederlandse parkeerborden, code = uiterlijk):
+   E1 = rond, rode rand, enkele rode diagonale streep (parkeerverbod)
+   E2 = rond, rood X kruis (stilstaan verboden)
+   E3 = fiets met rode diagonale streep
+   E4 = blauw "P", zonder vergunningtekst (voorwaarden kunnen op onderbord staan)
+   E4_ELECTRIC = blauw "P" met stekker/oplaadsymbool
+   E5 = "TAXI"
+   E6 = WIT ROLSTOEL SYMBOOL - verplicht
+   E7 = vrachtwagen/lading symbool (laden/lossen)
+   E8 = blauw "P", voertuigtype op onderbord
+   E9 = blauw "P" met tekst "vergunninghouders", GEEN rolstoel
+   E10 = parkeerschijf symbool
+   G7 = voetganger symbool
+   !! "vergunninghouders" zonder rolstoel icoon is E9, NIET E6. Gebruik E6 alleen als je het rolstoel icoon ziet.
+   Rapporteer ook de tekst op het onderbord en de geschatte afstand van voertuig tot bord.
+
+3. VOORRUIT: gehandicaptenparkeerkaart, vergunning/ontheffing document, parkeerschijf.
+
+4. WEGMARKERING: gele doorgetrokken streep, gele onderbroken streep, witte parkeerlijnen, andere markeringen, voertuig langs/op de gele streep.
+
+5. OMGEVING: bestuurder in/nabij voertuig, laad/los activiteit, andere personen nabij voertuig, voertuig aangesloten op oplaadpunt (indien van toepassing).
+
+6. BEELDKWALITEIT: licht (dag / nacht / kunstlicht), kwaliteit (goed / matig / slecht), leesbaarheid kenteken (volledig / gedeeltelijk / geen).
+
+OUTPUT FORMAAT: alleen geldige JSON (geen markdown codeblokken), met de structuur uit het systeembericht.
+
+REGELS:
+- Rapporteer ALLEEN waarneembare feiten; maak geen aannames over wat niet zichtbaar is
+- GEEN juridische interpretaties; gebruik geen woorden als "overtreding", "illegaal", "toegestaan", "verboden"
+- Betrouwbaarheid geeft visuele zekerheid weer, niet juridische zekerheid
+
+VOORRUIT ITEMS (yes / no / not_visible):
+- "yes" = document duidelijk zichtbaar
+- "no" = enig deel van het voorruit-interieur of dashboard is zichtbaar en het document ontbreekt (schittering telt niet als geblokkeerd)
+- "not_visible" = ALLEEN als het interieur volledig onzichtbaar is (100% reflectie, volledig beslagen, of niet in beeld)
+Bij twijfel: gebruik "no"; in ~95% van de parkeerfoto's is dat het juiste antwoord voor ontbrekende documenten.
+"""
+
+
+# Output structure, sent as the system message so it forms a shared, cacheable
+# prefix and is kept out of the per-request user prompt.
+LAYER2_SYSTEM_MESSAGE_EN = """Respond with a single JSON object with exactly this structure:
 {
   "vehicle": {
     "type": "string (passenger car, van, truck, motorcycle, other)",
@@ -114,96 +149,10 @@ OUTPUT FORMAT: JSON (valid JSON only, no markdown code blocks)
   },
   "observation_summary": "string (2-3 sentences, factual only, NO legal conclusions)"
 }
-
-IMPORTANT RULES:
-- Report ONLY what you actually see in the images
-- DO NOT make assumptions about what is not visible
-- DO NOT provide any legal interpretations or conclusions
-- DO NOT use words like "violation", "illegal", "permitted", "prohibited"
-- Only describe observable facts
-- Confidence scores should reflect visual certainty, not legal certainty
-
-CRITICAL: Understanding YES / NO / NOT_VISIBLE:
-- "yes" = Item IS clearly visible and present
-- "no" = You CAN see the windshield/dashboard area, but NO document is there (confirmed absence)
-- "not_visible" = ONLY use when windshield is COMPLETELY obscured (100% reflection, fully fogged, or not in frame)
-
-DEFAULT BEHAVIOR: If you can see ANY part of the windshield interior or dashboard, use "no" for missing items.
-Reserve "not_visible" ONLY for cases where the windshield is completely unobservable.
-
-For windshield items (permit, disability card, parking disc):
-- You can see the windshield/dashboard area, no document present → "no"
-- Windshield is 100% obscured by reflection/fog, cannot see inside at all → "not_visible"
-- Document is clearly visible → "yes"
-
-IMPORTANT: Most parking enforcement photos show the windshield clearly enough to confirm absence of documents.
-If you can see the dashboard or interior through the windshield, even partially, you can confirm "no" for missing items.
-Do NOT use "not_visible" just because there is some glare - only use it when you truly cannot see the interior AT ALL.
-
-WHEN IN DOUBT: Always prefer "no" over "not_visible". Use "not_visible" ONLY as a last resort when you genuinely cannot see the windshield area at all. In 95% of parking photos, the correct answer for missing documents is "no", not "not_visible".
 """
 
 
-LAYER2_PROMPT_NL = """Je bent een objectieve beeldanalist. Beschrijf ALLEEN wat je ziet.
-Geef GEEN juridische interpretaties of conclusies.
-
-Analyseer de afbeelding(en) en rapporteer:
-
-1. VOERTUIGOBSERVATIE:
-   - Voertuigtype (personenauto, bestelbus, vrachtwagen, motorfiets, etc.)
-   - Kleur
-   - Kenteken (indien zichtbaar, exact overnemen)
-   - Positie op de weg/parkeerplaats
-
-2. VERKEERSBORD OBSERVATIE:
-   ⚠️ KRITIEK ONDERSCHEID - LEES ZORGVULDIG:
-   - E6 (Gehandicaptenparkeren) = Blauw bord met WIT ROLSTOEL SYMBOOL (♿) - MOET rolstoel icoon hebben
-   - E9 (Vergunninghouders) = Blauw "P" bord met tekst "vergunninghouders" - GEEN rolstoel symbool, alleen tekst
-
-   🚨 BELANGRIJK: Als het bord "vergunninghouders" tekst toont ZONDER rolstoel symbool, is het E9, NIET E6!
-   🚨 Classificeer alleen als E6 als je een daadwerkelijk rolstoel icoon (♿) op het bord ziet!
-
-   Volledige identificatiegids (Nederlandse E-serie parkeerborden):
-     * E1 = Parkeerverbod: Rond blauw bord met rode rand en enkele rode diagonale streep
-     * E2 = Stilstaan verboden: Rond blauw bord met rood X kruis
-     * E3 = Verbod fietsen/bromfietsen te plaatsen: Blauw bord met fiets en rode diagonale streep
-     * E4 = Parkeergelegenheid: Blauw rechthoekig "P" bord zonder vergunningtekst - kan voorwaarden op onderbord hebben
-     * E5 = Taxistandplaats: Blauw rechthoekig bord met "TAXI" tekst
-     * E6 = Gehandicaptenparkeerplaats: MOET WIT ROLSTOEL SYMBOOL (♿) hebben
-     * E7 = Laden/lossen zone: Blauw bord met vrachtwagen/lading symbool
-     * E8 = Aangegeven voertuigen: Blauw "P" bord met specifiek voertuigtype op onderbord
-     * E9 = Vergunninghouders parkeren: Blauw "P" bord met tekst "vergunninghouders" (GEEN rolstoel!)
-     * E10 = Parkeerschijf-zone: Blauw rechthoekig bord met parkeerschijf symbool
-     * G7 = Voetgangersgebied: Blauw bord met voetganger symbool
-     * E4_ELECTRIC = EV Oplaadpunt: Blauw "P" bord met elektrische stekker/oplaadsymbool
-   - Is er een onderbord aanwezig? Zo ja, wat staat erop?
-   - Geschatte afstand van voertuig tot bord
-
-3. VOORRUIT OBSERVATIE:
-   - Is er iets zichtbaar achter de voorruit?
-   - Gehandicaptenparkeerkaart: JA / NEE / NIET ZICHTBAAR
-   - Vergunning/ontheffing document: JA / NEE / NIET ZICHTBAAR
-   - Parkeerschijf: JA / NEE / NIET ZICHTBAAR
-
-4. WEGMARKERING OBSERVATIE:
-   - Gele doorgetrokken streep: JA / NEE
-   - Gele onderbroken streep: JA / NEE
-   - Witte parkeerlijnen: JA / NEE
-   - Andere wegmarkeringen: beschrijf indien aanwezig
-   - Staat voertuig langs/op de gele streep: JA / NEE
-
-5. OMGEVINGSOBSERVATIE:
-   - Bestuurder aanwezig in of nabij voertuig: JA / NEE
-   - Laad/los activiteit zichtbaar: JA / NEE
-   - Andere personen nabij voertuig: JA / NEE
-   - Voertuig aangesloten op oplaadpunt (indien van toepassing): JA / NEE / NVT
-
-6. BEELDKWALITEIT:
-   - Lichtomstandigheden: dag / nacht / kunstlicht
-   - Beeldkwaliteit: goed / matig / slecht
-   - Leesbaarheid kenteken: volledig / gedeeltelijk / geen
-
-OUTPUT FORMAAT: JSON (alleen geldige JSON, geen markdown codeblokken)
+LAYER2_SYSTEM_MESSAGE_NL = """Antwoord met een enkel JSON object met precies deze structuur:
 {
   "vehicle": {
     "type": "string (personenauto, bestelbus, vrachtwagen, motorfiets, anders)",
@@ -245,91 +194,129 @@ OUTPUT FORMAAT: JSON (alleen geldige JSON, geen markdown codeblokken)
   },
   "observation_summary": "string (2-3 zinnen, alleen feiten, GEEN juridische conclusies)"
 }
+"""
 
-BELANGRIJKE REGELS:
-- Rapporteer ALLEEN wat je daadwerkelijk ziet in de afbeeldingen
-- Maak GEEN aannames over wat niet zichtbaar is
-- Geef GEEN juridische interpretaties of conclusies
-- Gebruik NIET woorden als "overtreding", "illegaal", "toegestaan", "verboden"
-- Beschrijf alleen waarneembare feiten
-- Betrouwbaarheidsscores moeten visuele zekerheid weergeven, niet juridische zekerheid
 
-KRITIEK: Begrip van YES / NO / NOT_VISIBLE:
-- "yes" = Item IS duidelijk zichtbaar en aanwezig
-- "no" = Je KUNT de voorruit/dashboard zien, maar er is GEEN document aanwezig (bevestigde afwezigheid)
-- "not_visible" = ALLEEN gebruiken wanneer voorruit VOLLEDIG geblokkeerd is (100% reflectie, volledig beslagen, of niet in beeld)
+_LAYER2_PROMPTS = {"en": LAYER2_PROMPT_EN, "nl": LAYER2_PROMPT_NL}
+_LAYER2_SYSTEM_MESSAGES = {"en": LAYER2_SYSTEM_MESSAGE_EN, "nl": LAYER2_SYSTEM_MESSAGE_NL}
 
-STANDAARD GEDRAG: Als je ENIG deel van het voorruit-interieur of dashboard kunt zien, gebruik "no" voor ontbrekende items.
-Reserveer "not_visible" ALLEEN voor gevallen waarin de voorruit volledig onzichtbaar is.
 
-Voor voorruit items (vergunning, gehandicaptenkaart, parkeerschijf):
-- Je kunt de voorruit/dashboard zien, geen document aanwezig → "no"
-- Voorruit is 100% geblokkeerd door reflectie/condens, interieur totaal niet zichtbaar → "not_visible"
-- Document is duidelijk zichtbaar → "yes"
+def get_layer2_prompt(language: str = "en") -> str:
+    """
+    Get the Layer 2 objective analysis prompt in the specified language.
 
-BELANGRIJK: De meeste parkeerhandhavingsfoto's tonen de voorruit duidelijk genoeg om afwezigheid van documenten te bevestigen.
-Als je het dashboard of interieur door de voorruit kunt zien, zelfs gedeeltelijk, kun je "no" bevestigen voor ontbrekende items.
-Gebruik "not_visible" NIET alleen omdat er wat schittering is - gebruik het alleen wanneer je het interieur HELEMAAL niet kunt zien.
+    Args:
+        language: "en" for English, "nl" for Dutch
 
-BIJ TWIJFEL: Geef altijd de voorkeur aan "no" boven "not_visible". Gebruik "not_visible" ALLEEN als laatste redmiddel wanneer je de voorruit echt helemaal niet kunt zien. In 95% van de parkeerfoto's is het juiste antwoord voor ontbrekende documenten "no", niet "not_visible".
-"""
+    Returns:
+        The prompt string
+    """
+    prompt = _LAYER2_PROMPTS.get(language)
+    if prompt is None:
+        prompt = _LAYER2_PROMPTS.get(language.lower(), LAYER2_PROMPT_EN)
+    return prompt
 
 
-def get_layer2_prompt(language: str = "en") -> str:
+def get_layer2_system_message(language: str = "en") -> str:
     """
-    Get the Layer 2 objective analysis prompt in the specified language.
+    Get the Layer 2 system message describing the JSON output structure.
 
     Args:
         language: "en" for English, "nl" for Dutch
 
     Returns:
-        The prompt string
+        The system message string
     """
-    if language.lower() == "nl":
-        return LAYER2_PROMPT_NL
-    return LAYER2_PROMPT_EN
+    message = _LAYER2_SYSTEM_MESSAGES.get(language)
+    if message is None:
+        message = _LAYER2_SYSTEM_MESSAGES.get(language.lower(), LAYER2_SYSTEM_MESSAGE_EN)
+    return message
 
 
-def build_layer2_message(
-    language: str = "en",
-    document_context: dict = None
-) -> str:
+def get_layer2_instructions(language: str = "en") -> str:
     """
-    Build the complete Layer 2 prompt with optional document context.
+    Get the static Layer 2 instructions followed by the JSON output structure.
+
+    Sent as one system prompt, this is the same for every case and long
+    enough to be cached by Anthropic prompt caching (about 1.1k tokens in
+    English), so only the images and the document context vary per request.
+
+    Args:
+        language: "en" for English, "nl" for Dutch
+
+    Returns:
+        The prompt and the system message, separated by a blank line
+    """
+    return get_layer2_prompt(language) + "\n\n" + get_layer2_system_message(language)
+
+
+def build_layer2_context(document_context: dict = None) -> str:
+    """
+    Build the per-request document context section for the Layer 2 prompt.
+
+    The section is always appended after the static base prompt, so the
+    base prompt stays an identical, cacheable prefix across requests.
 
     Args:
-        language: "en" or "nl"
         document_context: Optional dictionary with extracted document info
             (violation_code, vehicle_info, location, etc.)
 
     Returns:
-        Complete prompt string
+        Context section string, or "" when there is no context
     """
-    base_prompt = get_layer2_prompt(language)
-
     if not document_context:
-        return base_prompt
+        return ""
 
     # Add document context as reference (but still instruct to observe only)
-    context_section = "\n\nDOCUMENT CONTEXT (for reference only - still report only what you observe):\n"
+    parts = ["\n\nDOCUMENT CONTEXT (for reference only - still report only what you observe):\n"]
 
     if document_context.get("violation_code"):
-        context_section += f"- Reported violation type: {document_context['violation_code']}\n"
+        parts.append(f"- Reported violation type: {document_context['violation_code']}\n")
 
     if document_context.get("license_plate"):
-        context_section += f"- Reported license plate: {document_context['license_plate']}\n"
+        parts.append(f"- Reported license plate: {document_context['license_plate']}\n")
 
     if document_context.get("location"):
-        context_section += f"- Location: {document_context['location']}\n"
+        parts.append(f"- Location: {document_context['location']}\n")
 
     if document_context.get("datetime"):
-        context_section += f"- Date/Time: {document_context['datetime']}\n"
+        parts.append(f"- Date/Time: {document_context['datetime']}\n")
 
-    context_section += "\nRemember: Report what you SEE, not what the document says."
+    parts.append("\nRemember: Report what you SEE, not what the document says.")
 
-    return base_prompt + context_section
+    return "".join(parts)
 
 
+def build_layer2_message(
+    language: str = "en",
+    document_context: dict = None
+) -> str:
+    """
+    Build the complete Layer 2 prompt with optional document context.
+
+    The result always starts with the unmodified base prompt from
+    get_layer2_prompt(); without context it is exactly that prompt.
+    Backends with prefix caching can register get_layer2_prompt() as a
+    shared prefix. Per-request content (context, images) must come after
+    it, never between the base prompt and the context section. The JSON
+    output structure is sent separately via get_layer2_system_message().
+
+    Args:
+        language: "en" or "nl"
+        document_context: Optional dictionary with extracted document info
+            (violation_code, vehicle_info, location, etc.)
+
+    Returns:
+        Complete prompt string
+    """
+    return get_layer2_prompt(language) + build_layer2_context(document_context)
+
+
+# Schema fragments shared by several properties (one object each at import)
+_WINDSHIELD_ITEM_ENUM = ["yes", "no", "not_visible"]
+_PROBABILITY = {"type": "number", "minimum": 0, "maximum": 1}
+_OPTIONAL_STRING = {"type": ["string", "null"]}
+
 # Expected output schema for validation
 LAYER2_OUTPUT_SCHEMA = {
     "type": "object",
@@ -345,9 +332,9 @@ LAYER2_OUTPUT_SCHEMA = {
                     "type": "object",
                     "required": ["value", "visibility", "confidence"],
                     "properties": {
-                        "value": {"type": ["string", "null"]},
+                        "value": _OPTIONAL_STRING,
                         "visibility": {"type": "string", "enum": ["full", "partial", "none"]},
-                        "confidence": {"type": "number", "minimum": 0, "maximum": 1}
+                        "confidence": _PROBABILITY
                     }
                 },
                 "position": {"type": "string"}
@@ -359,19 +346,19 @@ LAYER2_OUTPUT_SCHEMA = {
             "properties": {
                 "detected": {"type": "boolean"},
                 "sign_code": {"type": "string"},
-                "sub_sign_text": {"type": ["string", "null"]},
-                "distance_estimate": {"type": ["string", "null"]},
-                "confidence": {"type": "number", "minimum": 0, "maximum": 1}
+                "sub_sign_text": _OPTIONAL_STRING,
+                "distance_estimate": _OPTIONAL_STRING,
+                "confidence": _PROBABILITY
             }
         },
         "windshield_items": {
             "type": "object",
             "required": ["disability_card", "permit", "parking_disc"],
             "properties": {
-                "disability_card": {"type": "string", "enum": ["yes", "no", "not_visible"]},
-                "permit": {"type": "string", "enum": ["yes", "no", "not_visible"]},
-                "parking_disc": {"type": "string", "enum": ["yes", "no", "not_visible"]},
-                "other_items": {"type": ["string", "null"]}
+                "disability_card": {"type": "string", "enum": _WINDSHIELD_ITEM_ENUM},
+                "permit": {"type": "string", "enum": _WINDSHIELD_ITEM_ENUM},
+                "parking_disc": {"type": "string", "enum": _WINDSHIELD_ITEM_ENUM},
+                "other_items": _OPTIONAL_STRING
             }
         },
         "road_markings": {
@@ -382,7 +369,7 @@ LAYER2_OUTPUT_SCHEMA = {
                 "yellow_line_type": {"type": "string", "enum": ["continuous", "dashed", "none"]},
                 "vehicle_alongside_yellow": {"type": "boolean"},
                 "white_parking_lines": {"type": "boolean"},
-                "other_markings": {"type": ["string", "null"]}
+                "other_markings": _OPTIONAL_STRING
             }
         },
         "environment": {
@@ -400,3 +387,12 @@ LAYER2_OUTPUT_SCHEMA = {
         "observation_summary": {"type": "string"}
     }
 }
+
+
+# Schema validator compiled once at import (optional dependency).
+# Call LAYER2_VALIDATE(obj); raises fastjsonschema.JsonSchemaException on mismatch.
+try:
+    import fastjsonschema
+    LAYER2_VALIDATE = fastjsonschema.compile(LAYER2_OUTPUT_SCHEMA)
+except ImportError:
+    LAYER2_VALIDATE = None
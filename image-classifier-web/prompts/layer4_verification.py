@@ -12,6 +12,7 @@ Version: 2.0
 """
 
 import json
+from collections import Counter
 from typing import Optional
 
 
@@ -31,30 +32,7 @@ TASKS:
 2. Identify matches and discrepancies
 3. Assess the overall consistency between sources
 
-OUTPUT FORMAT: JSON (valid JSON only, no markdown code blocks)
-{{
-  "verification": {{
-    "observation_supported": true | false,
-    "matching_elements": [
-      {{"element": "string describing what matches", "source": "image | officer | both"}}
-    ],
-    "discrepancies": [
-      {{
-        "item": "string describing the discrepancy",
-        "image_says": "what the image analysis found",
-        "officer_says": "what the officer reported",
-        "severity": "minor | major"
-      }}
-    ],
-    "missing_from_image": ["items mentioned by officer but not visible in images"],
-    "overall_confidence": 0.0-1.0
-  }},
-  "recommendation": {{
-    "action": "approve | manual_review | reject",
-    "reason": "string explaining the recommendation",
-    "manual_review_points": ["specific items needing human review"]
-  }}
-}}
+OUTPUT FORMAT: valid JSON only (no markdown code blocks), using the structure from the system message.
 
 IMPORTANT RULES:
 - The police observation is the GOLD STANDARD
@@ -82,41 +60,92 @@ TAKEN:
 2. Identificeer overeenkomsten en discrepanties
 3. Beoordeel de algehele consistentie tussen bronnen
 
-OUTPUT FORMAAT: JSON (alleen geldige JSON, geen markdown codeblokken)
-{{
-  "verification": {{
+OUTPUT FORMAAT: alleen geldige JSON (geen markdown codeblokken), met de structuur uit het systeembericht.
+
+BELANGRIJKE REGELS:
+- De politie-observatie is de GOUDEN STANDAARD
+- Bij twijfel: recommendation = "manual_review"
+- "major" discrepanties: tegenstrijdigheden die juridische geldigheid beïnvloeden
+- "minor" discrepanties: kleine verschillen die de zaak niet beïnvloeden
+- Als agent iets zegt dat beeld niet kan bevestigen: markeer als "missing_from_image", NIET als discrepantie
+- Markeer alleen als "approve" als beeldanalyse de agent-observatie ONDERSTEUNT
+"""
+
+
+# Output structure, sent as the system message so it forms a shared, cacheable
+# prefix and is kept out of the per-request user prompt.
+LAYER4_SYSTEM_MESSAGE_EN = """Respond with a single JSON object with exactly this structure:
+{
+  "verification": {
     "observation_supported": true | false,
     "matching_elements": [
-      {{"element": "beschrijving van wat overeenkomt", "source": "image | officer | both"}}
+      {"element": "string describing what matches", "source": "image | officer | both"}
     ],
     "discrepancies": [
-      {{
+      {
+        "item": "string describing the discrepancy",
+        "image_says": "what the image analysis found",
+        "officer_says": "what the officer reported",
+        "severity": "minor | major"
+      }
+    ],
+    "missing_from_image": ["items mentioned by officer but not visible in images"],
+    "overall_confidence": 0.0-1.0
+  },
+  "recommendation": {
+    "action": "approve | manual_review | reject",
+    "reason": "string explaining the recommendation",
+    "manual_review_points": ["specific items needing human review"]
+  }
+}
+"""
+
+
+LAYER4_SYSTEM_MESSAGE_NL = """Antwoord met een enkel JSON object met precies deze structuur:
+{
+  "verification": {
+    "observation_supported": true | false,
+    "matching_elements": [
+      {"element": "beschrijving van wat overeenkomt", "source": "image | officer | both"}
+    ],
+    "discrepancies": [
+      {
         "item": "beschrijving van de discrepantie",
         "image_says": "wat de beeldanalyse vond",
         "officer_says": "wat de agent rapporteerde",
         "severity": "minor | major"
-      }}
+      }
     ],
     "missing_from_image": ["items genoemd door agent maar niet zichtbaar in afbeeldingen"],
     "overall_confidence": 0.0-1.0
-  }},
-  "recommendation": {{
+  },
+  "recommendation": {
     "action": "approve | manual_review | reject",
     "reason": "uitleg van de aanbeveling",
     "manual_review_points": ["specifieke punten die menselijke beoordeling nodig hebben"]
-  }}
-}}
-
-BELANGRIJKE REGELS:
-- De politie-observatie is de GOUDEN STANDAARD
-- Bij twijfel: recommendation = "manual_review"
-- "major" discrepanties: tegenstrijdigheden die juridische geldigheid beïnvloeden
-- "minor" discrepanties: kleine verschillen die de zaak niet beïnvloeden
-- Als agent iets zegt dat beeld niet kan bevestigen: markeer als "missing_from_image", NIET als discrepantie
-- Markeer alleen als "approve" als beeldanalyse de agent-observatie ONDERSTEUNT
+  }
+}
 """
 
 
+_LAYER4_PROMPTS = {"en": LAYER4_PROMPT_EN, "nl": LAYER4_PROMPT_NL}
+_LAYER4_SYSTEM_MESSAGES = {"en": LAYER4_SYSTEM_MESSAGE_EN, "nl": LAYER4_SYSTEM_MESSAGE_NL}
+
+
+def _split_layer4_template(template: str) -> tuple:
+    """Split a Layer 4 template into the 4 static parts around its placeholders."""
+    sentinel = "\x00"
+    return tuple(template.format(
+        mllm_analysis=sentinel,
+        rule_engine_results=sentinel,
+        officer_observation=sentinel
+    ).split(sentinel))
+
+
+# Static template parts, split once at import so building a prompt is a single join
+_LAYER4_PARTS = {lang: _split_layer4_template(t) for lang, t in _LAYER4_PROMPTS.items()}
+
+
 def get_layer4_prompt(language: str = "en") -> str:
     """
     Get the Layer 4 verification prompt in the specified language.
@@ -127,9 +156,26 @@ def get_layer4_prompt(language: str = "en") -> str:
     Returns:
         The prompt template string
     """
-    if language.lower() == "nl":
-        return LAYER4_PROMPT_NL
-    return LAYER4_PROMPT_EN
+    prompt = _LAYER4_PROMPTS.get(language)
+    if prompt is None:
+        prompt = _LAYER4_PROMPTS.get(language.lower(), LAYER4_PROMPT_EN)
+    return prompt
+
+
+def get_layer4_system_message(language: str = "en") -> str:
+    """
+    Get the Layer 4 system message describing the JSON output structure.
+
+    Args:
+        language: "en" for English, "nl" for Dutch
+
+    Returns:
+        The system message string
+    """
+    message = _LAYER4_SYSTEM_MESSAGES.get(language)
+    if message is None:
+        message = _LAYER4_SYSTEM_MESSAGES.get(language.lower(), LAYER4_SYSTEM_MESSAGE_EN)
+    return message
 
 
 def build_layer4_prompt(
@@ -141,6 +187,9 @@ def build_layer4_prompt(
     """
     Build the complete Layer 4 verification prompt with all inputs.
 
+    Send it together with get_layer4_system_message(language) as the system
+    message, which describes the expected JSON output.
+
     Args:
         mllm_analysis: Output from Layer 2 (MLLM objective analysis)
         rule_engine_results: Output from Layer 3 (Rule Engine evaluation)
@@ -150,17 +199,20 @@ def build_layer4_prompt(
     Returns:
         Complete prompt string ready for MLLM
     """
-    template = get_layer4_prompt(language)
+    parts = _LAYER4_PARTS.get(language)
+    if parts is None:
+        parts = _LAYER4_PARTS.get(language.lower(), _LAYER4_PARTS["en"])
 
     # Format the inputs as JSON strings for the prompt
     mllm_json = json.dumps(mllm_analysis, indent=2, ensure_ascii=False)
     rule_json = json.dumps(rule_engine_results, indent=2, ensure_ascii=False)
 
-    return template.format(
-        mllm_analysis=mllm_json,
-        rule_engine_results=rule_json,
-        officer_observation=officer_observation or "[No officer observation provided]"
-    )
+    return "".join((
+        parts[0], mllm_json,
+        parts[1], rule_json,
+        parts[2], officer_observation or "[No officer observation provided]",
+        parts[3]
+    ))
 
 
 def parse_layer4_response(response_text: str) -> dict:
@@ -176,16 +228,10 @@ def parse_layer4_response(response_text: str) -> dict:
     # Try to extract JSON from the response
     try:
         # Handle markdown code blocks
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            json_str = response_text[start:end].strip()
-        elif "```" in response_text:
-            start = response_text.find("```") + 3
-            end = response_text.find("```", start)
-            json_str = response_text[start:end].strip()
-        else:
-            json_str = response_text.strip()
+        _, sep, tail = response_text.partition("```json")
+        if not sep:
+            _, sep, tail = response_text.partition("```")
+        json_str = (tail.partition("```")[0] if sep else response_text).strip()
 
         return json.loads(json_str)
 
@@ -226,8 +272,9 @@ def calculate_observation_match_score(verification_result: dict) -> float:
 
     # Adjust based on discrepancies
     discrepancies = verification.get("discrepancies", [])
-    major_count = sum(1 for d in discrepancies if d.get("severity") == "major")
-    minor_count = sum(1 for d in discrepancies if d.get("severity") == "minor")
+    severity_counts = Counter(d.get("severity") for d in discrepancies)
+    major_count = severity_counts["major"]
+    minor_count = severity_counts["minor"]
 
     # Deduct for discrepancies
     penalty = (major_count * 0.15) + (minor_count * 0.05)
@@ -249,6 +296,10 @@ def merge_verification_with_evaluation(
 
     Creates the combined result structure used for action determination.
 
+    The merge is shallow: list and dict values (checks, legal_references,
+    discrepancies, ...) are shared with the inputs, not copied. Treat the
+    result as read-only, or copy the specific value before mutating it.
+
     Args:
         rule_engine_result: Output from evaluate_legal_compliance()
         verification_result: Parsed Layer 4 verification output
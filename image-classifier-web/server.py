@@ -1,22 +1,33 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, abort, redirect, request, jsonify, render_template, send_from_directory, stream_with_context, url_for
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.security import safe_join
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
 import os
 
 # Load environment variables from .env file
 load_dotenv()
+import hashlib
 import json
+import mimetypes
 import re
+import shutil
+import sys
+import threading
+import uuid
+from array import array
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 import logging
 
 # Import PDF extraction functions
-from extract_images import extract_embedded_images, write_manifest
+from extract_images import extract_embedded_images, sanitize_stem, write_manifest
 import fitz
 
 # Import SAM3 service
-from sam3_service import SAM3Analyzer, analyze_evidence_images
+from sam3_service import SAM3Analyzer, EvidenceRequestBatcher
 
 # Import Claude Vision service for MLLM
 from claude_vision_service import ClaudeVisionService, analyze_parking_evidence
@@ -34,7 +45,7 @@ from confidence_merger import (
 )
 
 # Import for parallel processing
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
 # Import centralized violation codes for R-code to E-code mapping
 from legal.violation_codes import (
@@ -54,6 +65,19 @@ from legal.thresholds import determine_action, format_action_for_ui
 # Import legal statement generator for proper legal output
 from legal.templates import generate_legal_statement
 
+# Optional: flask-compress for gzip/brotli responses
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Optional: orjson for faster jsonify/tojson serialization
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -61,6 +85,31 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__, template_folder='templates', static_folder='static')
 CORS(app)
 
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson; used by jsonify and the tojson filter."""
+
+        OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            # Serialize straight into the response body, skipping the
+            # bytes -> str -> bytes round trip of dumps()
+            option = self.OPTIONS | orjson.OPT_APPEND_NEWLINE
+            if self.compact is None and self._app.debug:
+                option |= orjson.OPT_INDENT_2
+            return self._app.response_class(
+                orjson.dumps(self._prepare_response_obj(args, kwargs), default=self.default, option=option),
+                mimetype=self.mimetype
+            )
+
+    app.json = OrjsonProvider(app)
+
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
 DATA_FOLDER = os.path.join(os.path.dirname(__file__), 'data')
 DERIVED_FOLDER = os.path.join(DATA_FOLDER, 'derived')
@@ -70,6 +119,39 @@ os.makedirs(DERIVED_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['DATA_FOLDER'] = DATA_FOLDER
 app.config['DERIVED_FOLDER'] = DERIVED_FOLDER
+# Larger request bodies are refused with 413 before anything is read or parsed
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_MB', '100')) * 1024 * 1024
+
+# Compiled templates are cached on disk, so new worker processes load
+# result.html's bytecode instead of parsing the template again
+JINJA_CACHE_FOLDER = os.path.join(os.path.dirname(__file__), '.jinja_cache')
+os.makedirs(JINJA_CACHE_FOLDER, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_FOLDER)
+
+# Text responses (the rendered report is large) are compressed when
+# flask-compress is installed; images and the /events stream are left alone
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json', 'text/css', 'application/javascript']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+
+# ═══════════════════════════════════════════════════════════════════════
+# FILE SERVING
+# ═══════════════════════════════════════════════════════════════════════
+# Let the reverse proxy stream uploads/data files with sendfile(2) instead of
+# pushing bytes through a Python worker:
+#   SENDFILE_MODE=x-accel     nginx X-Accel-Redirect, e.g.
+#                             location /_protected/ { internal; alias /path/to/image-classifier-web/; }
+#   SENDFILE_MODE=x-sendfile  Apache mod_xsendfile / lighttpd X-Sendfile
+# Unset (or running with debug) serves files directly via send_from_directory.
+SENDFILE_MODE = os.getenv('SENDFILE_MODE', '').lower()
+X_ACCEL_PREFIX = os.getenv('X_ACCEL_PREFIX', '/_protected').rstrip('/')
+
+# Browser caching (seconds). Uploads are named by content hash and never
+# change; extracted images and SAM3 outputs are revalidated via ETag /
+# Last-Modified once this expires.
+UPLOAD_CACHE_MAX_AGE = 365 * 24 * 3600
+DATA_CACHE_MAX_AGE = 3600
 
 # ═══════════════════════════════════════════════════════════════════════
 # SAM MODEL CONFIGURATION
@@ -82,10 +164,81 @@ logger.info(f"SAM Mock Mode: {SAM_MOCK_MODE} (set SAM_MOCK_MODE=true in .env to
 # Initialize SAM3 Analyzer
 sam3_analyzer = SAM3Analyzer(output_dir=DERIVED_FOLDER, mock_mode=SAM_MOCK_MODE)
 
+# Concurrent /predict SAM requests share one batched analysis pass.
+# SAM_BATCH_MAX_REQUESTS caps requests per batch; SAM_BATCH_WAIT_MS is how
+# long the first request waits for others to join.
+SAM_BATCH_MAX_REQUESTS = int(os.getenv('SAM_BATCH_MAX_REQUESTS', '8'))
+SAM_BATCH_WAIT_MS = float(os.getenv('SAM_BATCH_WAIT_MS', '20'))
+SAM_REQUEST_TIMEOUT = 120  # seconds
+sam3_request_batcher = EvidenceRequestBatcher(
+    sam3_analyzer,
+    max_requests=SAM_BATCH_MAX_REQUESTS,
+    max_wait_ms=SAM_BATCH_WAIT_MS
+)
+
 # Initialize Claude Vision Service for MLLM
-claude_vision_service = ClaudeVisionService()
+claude_vision_service = ClaudeVisionService(enable_prompt_cache=True)
+
+# One OpenAI Vision Service per process: its client (and HTTP connection
+# pool) is reused by every request instead of being rebuilt per analysis
+openai_vision_service = OpenAIVisionService()
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'pdf'}
+
+# ═══════════════════════════════════════════════════════════════════════
+# WARM-UP
+# ═══════════════════════════════════════════════════════════════════════
+def _warm_up_pdf():
+    """Parse a tiny in-memory PDF so MuPDF initializes at boot, not on the first upload."""
+    try:
+        with fitz.open() as doc:
+            doc.new_page()
+            data = doc.tobytes()
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            doc[0].get_text()
+    except Exception as e:
+        logger.warning(f"PDF warm-up failed: {e}")
+
+
+_warm_up_pdf()
+
+# Set WARMUP=true to also send a 1-token Claude request in the background, so
+# the API connection is open before the first upload. Leave it off when
+# running gunicorn with --preload: forked workers must not share a connection
+# opened in the master process.
+if os.getenv('WARMUP', 'false').lower() == 'true' and claude_vision_service.is_available():
+    threading.Thread(target=claude_vision_service.warm_up, name="claude-warmup", daemon=True).start()
+
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp', 'pdf'})
+
+# Uploads are hashed and copied to disk with a 1 MiB buffer
+UPLOAD_COPY_BUFFER = 1 << 20
+
+# ASYNC_ANALYSIS=true: /predict only saves the upload, queues the analysis on
+# analysis_executor and redirects to /result/<job_id>, which shows a progress
+# page fed by Server-Sent Events from /events/<job_id> (or refreshing itself
+# without JavaScript) until the report is ready. Jobs live in this process,
+# so run a single worker process (scale with threads) when enabled.
+ASYNC_ANALYSIS = os.getenv('ASYNC_ANALYSIS', 'false').lower() == 'true'
+ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', '2'))
+ANALYSIS_JOB_HISTORY = 256
+ANALYSIS_POLL_SECONDS = 2
+ANALYSIS_EVENT_INTERVAL = 0.5
+analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analysis")
+_analysis_jobs = OrderedDict()
+_analysis_jobs_lock = threading.Lock()
+
+# Parsed PDF uploads (text + extracted image list) are cached by upload
+# digest in DERIVED_FOLDER, with the most recent PDF_CACHE_SIZE kept in memory
+PDF_CACHE_VERSION = 1
+PDF_CACHE_SIZE = 128
+_pdf_extractions = OrderedDict()
+_pdf_extractions_lock = threading.Lock()
+
+# Finished analyses are cached on disk by upload digest, language and model,
+# so re-uploading a known file renders its report without re-running the
+# models. Set CASE_CACHE=false to always re-analyze.
+CASE_CACHE = os.getenv('CASE_CACHE', 'true').lower() == 'true'
+CASE_CACHE_VERSION = 1
 
 # ==================== TRANSLATIONS ====================
 TRANSLATIONS = {
@@ -248,6 +401,67 @@ TRANSLATIONS = {
         'no_driver_present': 'No driver was present in or around the vehicle.',
         'violation_code': 'Violation',
         'no_description': 'No description available',
+
+        # Index page
+        'index_title': 'Image Classifier',
+        'index_subtitle': 'Automated evidence analysis and legal support.',
+        'upload_file': 'Upload File',
+        'select_error': 'Please select an image or PDF file before submitting.',
+        'settings': 'Settings',
+        'language_label': 'Language',
+        'language_en': 'English',
+        'language_nl': 'Nederlands',
+        'decision_support': 'Decision Support',
+        'decision_support_desc': 'Enable AI-powered legal reasoning suggestions',
+        'output_file_type': 'Output File Type',
+        'model_type': 'Model Type',
+        'model_desc_sam': 'Segmentation-based object detection for parking evidence',
+        'model_desc_mllm': 'Claude Vision AI for advanced image analysis',
+        'model_desc_openai': 'OpenAI GPT-4o Vision for advanced image analysis',
+        'model_desc_openai_sam': 'OpenAI + SAM combined pipeline - Coming Soon',
+        'model_desc_mock': 'Mock data for UI testing without API calls',
+        'mllm_coming_soon': 'MLLM analysis not available. Check API configuration.',
+        'start_analysis': 'Start Analysis & Save Settings',
+        'header_service': 'Image Classifier',
+        'choose_file': 'Choose File',
+        'no_file_chosen': 'No file chosen',
+        'drag_drop': 'or drag and drop a file here',
+        # SAM3 detection
+        'show_overlay': 'Show Segmentation',
+        'hide_overlay': 'Hide Segmentation',
+        'detected': 'detected',
+        'not_detected': 'not detected',
+        'roi_available': 'ROI available',
+        'view_crop': 'View Crop',
+        'detection_note': 'Detection based on automated image analysis. Manual verification recommended.',
+        'not_enough_info': 'Not enough information available',
+
+        # Loading animation
+        'analyzing': 'Analyzing...',
+        'processing_images': 'Processing images and extracting data',
+        'extracting_data': 'Extracting data',
+        'analyzing_images': 'Analyzing images',
+        'generating_report': 'Generating report',
+
+        # MLLM/Verification
+        'verification_status': 'Verification Status',
+        'observation_supported': 'Evidence supports observation',
+        'discrepancies_found': 'Discrepancies found',
+
+        # MLLM Report Section Labels
+        'detected_objects_mllm': 'Detected objects via MLLM analysis:',
+        'environmental_analysis_mllm': 'Environmental analysis via MLLM:',
+        'parking_permit': 'Parking Permit',
+        'driver': 'Driver',
+        'present': 'present',
+        'not_present': 'not present',
+        'time_of_day': 'Time of Day',
+        'lighting': 'Lighting',
+        'weather': 'Weather',
+        'environment': 'Environment',
+        'from_document_separator': '--- From Document ---',
+        'violation_label': 'Violation',
+        'clarification_label': 'Clarification',
     },
     'nl': {
         # Page titles
@@ -473,81 +687,194 @@ TRANSLATIONS = {
     }
 }
 
-# Add English index translations
-TRANSLATIONS['en'].update({
-    'index_title': 'Image Classifier',
-    'index_subtitle': 'Automated evidence analysis and legal support.',
-    'upload_file': 'Upload File',
-    'select_error': 'Please select an image or PDF file before submitting.',
-    'settings': 'Settings',
-    'language_label': 'Language',
-    'language_en': 'English',
-    'language_nl': 'Nederlands',
-    'decision_support': 'Decision Support',
-    'decision_support_desc': 'Enable AI-powered legal reasoning suggestions',
-    'output_file_type': 'Output File Type',
-    'model_type': 'Model Type',
-    'model_desc_sam': 'Segmentation-based object detection for parking evidence',
-    'model_desc_mllm': 'Claude Vision AI for advanced image analysis',
-    'model_desc_openai': 'OpenAI GPT-4o Vision for advanced image analysis',
-    'model_desc_openai_sam': 'OpenAI + SAM combined pipeline - Coming Soon',
-    'model_desc_mock': 'Mock data for UI testing without API calls',
-    'mllm_coming_soon': 'MLLM analysis not available. Check API configuration.',
-    'start_analysis': 'Start Analysis & Save Settings',
-    'header_service': 'Image Classifier',
-    'choose_file': 'Choose File',
-    'no_file_chosen': 'No file chosen',
-    'drag_drop': 'or drag and drop a file here',
-    # SAM3 detection
-    'show_overlay': 'Show Segmentation',
-    'hide_overlay': 'Hide Segmentation',
-    'detected': 'detected',
-    'not_detected': 'not detected',
-    'roi_available': 'ROI available',
-    'view_crop': 'View Crop',
-    'detection_note': 'Detection based on automated image analysis. Manual verification recommended.',
-    'not_enough_info': 'Not enough information available',
-
-    # Loading animation
-    'analyzing': 'Analyzing...',
-    'processing_images': 'Processing images and extracting data',
-    'extracting_data': 'Extracting data',
-    'analyzing_images': 'Analyzing images',
-    'generating_report': 'Generating report',
-
-    # MLLM/Verification
-    'verification_status': 'Verification Status',
-    'observation_supported': 'Evidence supports observation',
-    'discrepancies_found': 'Discrepancies found',
-
-    # MLLM Report Section Labels
-    'detected_objects_mllm': 'Detected objects via MLLM analysis:',
-    'environmental_analysis_mllm': 'Environmental analysis via MLLM:',
-    'parking_permit': 'Parking Permit',
-    'driver': 'Driver',
-    'present': 'present',
-    'not_present': 'not present',
-    'time_of_day': 'Time of Day',
-    'lighting': 'Lighting',
-    'weather': 'Weather',
-    'environment': 'Environment',
-    'from_document_separator': '--- From Document ---',
-    'violation_label': 'Violation',
-    'clarification_label': 'Clarification',
+# Freeze the tables: read-only views with interned keys, shared by all requests
+TRANSLATIONS = MappingProxyType({
+    lang: MappingProxyType({sys.intern(key): value for key, value in table.items()})
+    for lang, table in TRANSLATIONS.items()
+})
+_TR_DEFAULT = TRANSLATIONS['en']
+
+# Violation descriptions by language and code ('violation_E9' -> 'E9')
+_VIOLATION_KEY = re.compile(r"violation_([A-Z][A-Z0-9_]*)")
+_VIOLATION_DESC = MappingProxyType({
+    lang: MappingProxyType({
+        match.group(1): value
+        for match, value in ((_VIOLATION_KEY.fullmatch(key), value) for key, value in table.items())
+        if match
+    })
+    for lang, table in TRANSLATIONS.items()
+})
+
+# Per-language constants used by extract_structured_fields:
+# (not_available, not_specified, none, violation descriptions)
+_FIELD_TEXT = MappingProxyType({
+    lang: (table['not_available'], table['not_specified'], table['none'], _VIOLATION_DESC[lang])
+    for lang, table in TRANSLATIONS.items()
 })
 
 
 def get_translations(lang='en'):
     """Get translations for the specified language."""
-    return TRANSLATIONS.get(lang, TRANSLATIONS['en'])
+    return TRANSLATIONS.get(lang, _TR_DEFAULT)
+
+
+def _save_upload(stream, path):
+    """Copy an uploaded file stream to disk using a large buffer."""
+    # Write to a temp name first so a concurrent request never sees a partial file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as dst:
+        shutil.copyfileobj(stream, dst, length=UPLOAD_COPY_BUFFER)
+    os.replace(tmp_path, path)
+
+
+def _hash_upload(stream):
+    """BLAKE2b digest of an uploaded file stream; rewinds the stream afterwards."""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: stream.read(UPLOAD_COPY_BUFFER), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _file_extension(filename):
+    """Lower-cased text after the last '.', or None when there is no '.'."""
+    _, dot, ext = filename.rpartition('.')
+    return ext.lower() if dot else None
 
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return _file_extension(filename) in ALLOWED_EXTENSIONS
 
 
 def is_pdf(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() == 'pdf'
+    return _file_extension(filename) == 'pdf'
+
+
+# PDF readers accept the %PDF- header anywhere in the first 1 KiB
+PDF_HEADER_WINDOW = 1024
+
+
+def is_pdf_stream(stream):
+    """Check an uploaded stream for the %PDF- magic bytes; rewinds the stream afterwards."""
+    head = stream.read(PDF_HEADER_WINDOW)
+    stream.seek(0)
+    return b'%PDF-' in head
+
+
+def _pdf_cache_path(digest):
+    return os.path.join(app.config['DERIVED_FOLDER'], f"{digest}.pdf.json")
+
+
+def _remember_pdf_extraction(digest, extraction):
+    with _pdf_extractions_lock:
+        _pdf_extractions[digest] = extraction
+        _pdf_extractions.move_to_end(digest)
+        while len(_pdf_extractions) > PDF_CACHE_SIZE:
+            _pdf_extractions.popitem(last=False)
+
+
+def _load_pdf_extraction(digest):
+    """
+    Look up a previously parsed PDF upload.
+
+    Args:
+        digest: Content digest of the uploaded PDF
+
+    Returns:
+        (text, images) tuple, or None when not cached or when any
+        extracted image is no longer on disk
+    """
+    with _pdf_extractions_lock:
+        extraction = _pdf_extractions.get(digest)
+        if extraction is not None:
+            _pdf_extractions.move_to_end(digest)
+
+    if extraction is None:
+        try:
+            with open(_pdf_cache_path(digest), 'rb') as f:
+                raw = f.read()
+            cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != PDF_CACHE_VERSION:
+            return None
+        extraction = (cached['text'], cached['images'])
+        _remember_pdf_extraction(digest, extraction)
+
+    text, images = extraction
+    data_folder = app.config['DATA_FOLDER']
+    if not all(os.path.exists(os.path.join(data_folder, img['file'])) for img in images):
+        return None
+    return text, [dict(img) for img in images]
+
+
+def _store_pdf_extraction(digest, text, images):
+    """Cache a parsed PDF upload in memory and on disk (written atomically)."""
+    images = [dict(img) for img in images]
+    _remember_pdf_extraction(digest, (text, images))
+
+    path = _pdf_cache_path(digest)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        data = {'version': PDF_CACHE_VERSION, 'text': text, 'images': images}
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8'))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write PDF cache {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _case_cache_path(digest, lang, model_type):
+    return os.path.join(app.config['DERIVED_FOLDER'], f"{digest}.{model_type}.{lang}.case.json")
+
+
+def _load_case(digest, lang, model_type):
+    """
+    Look up a previously finished analysis of an upload.
+
+    Args:
+        digest: Content digest of the upload
+        lang: Language code (en/nl)
+        model_type: Analysis model the report was generated with
+
+    Returns:
+        Template context for result.html without 't', or None when not
+        cached or when any extracted image is no longer on disk
+    """
+    try:
+        with open(_case_cache_path(digest, lang, model_type), 'rb') as f:
+            cached = app.json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if cached.get('version') != CASE_CACHE_VERSION:
+        return None
+    context = cached['context']
+    data_folder = app.config['DATA_FOLDER']
+    if not all(os.path.exists(os.path.join(data_folder, img)) for img in context['extracted_images']):
+        return None
+    return context
+
+
+def _store_case(digest, lang, model_type, context):
+    """Cache a finished analysis on disk (written atomically); 't' is not stored."""
+    path = _case_cache_path(digest, lang, model_type)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        data = {'version': CASE_CACHE_VERSION,
+                'context': {k: v for k, v in context.items() if k != 't'}}
+        with open(tmp_path, 'wb') as f:
+            f.write(app.json.dumps(data).encode('utf-8'))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write case cache {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def _build_legal_references(violation_code: str) -> dict:
@@ -592,14 +919,186 @@ def _build_legal_references(violation_code: str) -> dict:
     return {}
 
 
-def extract_pdf_text(pdf_path):
-    """Extract all text from PDF for field extraction."""
-    doc = fitz.open(pdf_path)
-    full_text = ""
+# ==================== FIELD EXTRACTION PATTERNS ====================
+# Compiled once at import; extract_structured_fields runs them on every PDF
+_FIELD_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# "Label: value" fields as (label, value, suffix) regex parts
+_FIELD_SPECS = {
+    "volgnummer": (r"volgnummer[:\s]*", r"[A-Z0-9\-]+", ""),
+    "bonnummer": (r"bonnummer[:\s]*", r"[A-Z0-9\-]+", ""),
+    "brondocument": (r"brondocument[:\s]*", r"\d+", ""),
+    "status": (r"status[:\s]*", r"\w+", ""),
+    "datum_tijd": (r"datum[/\s]tijd[:\s]*", r"[0-9\-\s:]+", ""),
+    "medewerker": (r"medewerker[:\s]*", r"[A-Za-z\s\.]+", ""),
+    "plaats": (r"plaats[:\s]*", r"[A-Za-z\s]+", ""),
+    "stadsdeel": (r"stadsdeel[:\s]*", r"[A-Za-z\s\-]+", ""),
+    "buurt": (r"buurt[:\s]*", r"[A-Za-z\s\-]+", ""),
+    "straat": (r"straat[:\s]*", r"[A-Za-z\s]+", ""),
+    "locatie_nr": (r"(?:locatie\s*nr|huisnummer)[:\s]*", r"\d+", ""),
+    "overtreding": (r"overtreding[:\s]*", r".+?", r"(?:\n|$)"),
+    "toelichting": (r"toelichting[:\s]*", r".+?", r"(?:\n|$)"),
+    "reden_verwijdering": (r"reden\s*(?:van\s*)?verwijdering[:\s]*", r".+?", r"(?:\n|$)"),
+    "merk": (r"merk[:\s]*", r"[A-Za-z]+", ""),
+    "model": (r"model[:\s]*", r"[A-Za-z0-9\s]+", ""),
+    "kleur": (r"kleur[:\s]*", r"[A-Za-z]+", ""),
+}
+
+# All fields in one alternation. Each branch is a lookahead, so matches are
+# zero-width and one field's value never hides the next field's label: a
+# single left-to-right scan finds the same first match per field as a
+# separate re.search for each.
+_COMBINED_FIELDS = re.compile(
+    "|".join(
+        f"(?={label}(?P<{name}>{value}){suffix})"
+        for name, (label, value, suffix) in _FIELD_SPECS.items()
+    ),
+    _FIELD_FLAGS
+)
+_RE_DATE = re.compile(r"(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*(\d{1,2}:\d{2})?")
+# Two-digit E codes first so "E10" does not match E1 and backtrack at \b
+_RE_VIOLATION_CODE = re.compile(r"\b(E1[0-3]|E[1-9]|G[1-9]|R\d{3}[a-z]?)\b", re.IGNORECASE)
+_RE_YELLOW_LINE = re.compile(r"gele\s+doorgetrokken\s+streep", re.IGNORECASE)
+_RE_KENTEKEN = re.compile(r"\b([A-Z]{1,3}[-\s]?\d{1,3}[-\s]?[A-Z]{1,3}|\d{1,2}[-\s]?[A-Z]{2,3}[-\s]?\d{1,2})\b")
+_RE_OBSERVATION = re.compile(
+    r"(?:redenen\s*van\s*wetenschap|waarneming|observatie)[:\s]*(.+?)(?=\n\n|\Z)",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_SLEEPBON = re.compile(r"sleepbon[:\s]*([A-Z0-9\-]+)", re.IGNORECASE)
+
+
+# Case dates sit in the report header, so the first _DATE_HEAD_CHARS are
+# searched first. A match ending at least _DATE_MARGIN before that cut is the
+# same match a full-text search would return (a date needs at most 10 chars).
+_DATE_HEAD_CHARS = 4096
+_DATE_MARGIN = 64
+
+
+def _search_date(text):
+    """Return the first _RE_DATE match in text, scanning only the header when possible."""
+    if '-' not in text and '/' not in text:
+        return None
+    if len(text) > _DATE_HEAD_CHARS:
+        match = _RE_DATE.search(text, 0, _DATE_HEAD_CHARS)
+        if match and match.end() < _DATE_HEAD_CHARS - _DATE_MARGIN:
+            return match
+    return _RE_DATE.search(text)
+
+
+def _scan_fields(text):
+    """Return {field: stripped value} for the first occurrence of each field in text."""
+    found = {}
+    for match in _COMBINED_FIELDS.finditer(text):
+        name = match.lastgroup
+        if name not in found:
+            found[name] = match.group(name).strip()
+            if len(found) == len(_FIELD_SPECS):
+                break
+    return found
+
+
+def iter_pdf_text(doc):
+    """Yield the text of each page of an open fitz.Document, extracting pages lazily."""
     for page in doc:
-        full_text += page.get_text()
-    doc.close()
-    return full_text
+        yield page.get_text(sort=False)
+
+
+# PDFs with at least this many pages are extracted by several workers
+PDF_PARALLEL_MIN_PAGES = 8
+PDF_TEXT_WORKERS = min(os.cpu_count() or 1, 4)
+
+
+def _extract_page_range(pdf_path, lo, hi):
+    """Extract the text of pages [lo, hi) using a document opened by this worker."""
+    with fitz.open(pdf_path, filetype="pdf") as doc:
+        return [doc[i].get_text(sort=False) for i in range(lo, hi)]
+
+
+def extract_pdf_text(pdf):
+    """
+    Extract all text from PDF for field extraction.
+
+    Args:
+        pdf: Path of the PDF, or an already open fitz.Document (left open)
+
+    Returns:
+        Concatenated text of every page
+    """
+    if isinstance(pdf, fitz.Document):
+        return _extract_doc_text(pdf, pdf.name)
+    with fitz.open(pdf, filetype="pdf") as doc:
+        return _extract_doc_text(doc, pdf)
+
+
+def _extract_doc_text(doc, pdf_path):
+    page_count = len(doc)
+    workers = min(PDF_TEXT_WORKERS, page_count)
+    if page_count < PDF_PARALLEL_MIN_PAGES or workers < 2 or not pdf_path:
+        return "".join(iter_pdf_text(doc))
+
+    # fitz documents are not thread-safe, so each worker opens its own and
+    # extracts one contiguous range of pages
+    step = -(-page_count // workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        ranges = executor.map(
+            lambda lo: _extract_page_range(pdf_path, lo, min(lo + step, page_count)),
+            range(0, page_count, step)
+        )
+        return "".join(text for pages in ranges for text in pages)
+
+
+# Embedded images of multi-page PDFs are extracted by up to this many threads
+PDF_IMAGE_WORKERS = min(os.cpu_count() or 1, 8)
+
+
+def _extract_images_range(doc, lo, hi, pdf_stem, out_dir):
+    """Extract the embedded images of pages [lo, hi) of an open document."""
+    images = []
+    for page_num in range(lo, hi):
+        page_images, _ = extract_embedded_images(doc, page_num, pdf_stem, out_dir, min_size=200)
+        images.extend(page_images)
+    return images
+
+
+def _extract_images_range_from_path(pdf_path, lo, hi, pdf_stem, out_dir):
+    """Extract the embedded images of pages [lo, hi) using a document opened by this worker."""
+    with fitz.open(pdf_path, filetype="pdf") as doc:
+        return _extract_images_range(doc, lo, hi, pdf_stem, out_dir)
+
+
+def extract_pdf_images(doc, pdf_path, pdf_stem, out_dir):
+    """
+    Extract the embedded images of every page, in page order.
+
+    Image decoding and JPEG encoding release the GIL, so multi-page PDFs are
+    split into contiguous page ranges: the first range uses doc on this
+    thread, the others run on worker threads that each open their own
+    document (fitz documents are not thread-safe).
+
+    Args:
+        doc: Open fitz.Document for pdf_path
+        pdf_path: Path of the PDF, reopened by worker threads
+        pdf_stem: PDF filename stem for naming output files
+        out_dir: Output directory path
+
+    Returns:
+        List of image metadata dicts
+    """
+    page_count = len(doc)
+    workers = min(PDF_IMAGE_WORKERS, page_count)
+    if workers < 2:
+        return _extract_images_range(doc, 0, page_count, pdf_stem, out_dir)
+
+    step = -(-page_count // workers)
+    with ThreadPoolExecutor(max_workers=workers - 1) as executor:
+        futures = [
+            executor.submit(_extract_images_range_from_path, pdf_path, lo, min(lo + step, page_count), pdf_stem, out_dir)
+            for lo in range(step, page_count, step)
+        ]
+        images = _extract_images_range(doc, 0, step, pdf_stem, out_dir)
+        for future in futures:
+            images.extend(future.result())
+    return images
 
 
 def extract_structured_fields(text, lang='en'):
@@ -607,19 +1106,13 @@ def extract_structured_fields(text, lang='en'):
     Extract structured fields from Dutch parking/towing case PDF text.
     Returns a dictionary with case, location, violation, vehicle info.
     """
-    t = get_translations(lang)
-
-    # Helper to find field value
-    def find_field(pattern, text, default=None):
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        return match.group(1).strip() if match else default
-
-    not_available = t['not_available']
+    not_available, not_specified, none_text, violation_descs = _FIELD_TEXT.get(lang, _FIELD_TEXT['en'])
+    fields = _scan_fields(text)
 
     # Extract case identifiers
-    volgnummer = find_field(r"volgnummer[:\s]*([A-Z0-9\-]+)", text)
-    bonnummer = find_field(r"bonnummer[:\s]*([A-Z0-9\-]+)", text)
-    brondocument = find_field(r"brondocument[:\s]*(\d+)", text)
+    volgnummer = fields.get("volgnummer")
+    bonnummer = fields.get("bonnummer")
+    brondocument = fields.get("brondocument")
 
     # Debug logging for case extraction
     logger.info(f"Case extraction - Text length: {len(text)}, volgnummer: {volgnummer}, bonnummer: {bonnummer}, brondocument: {brondocument}")
@@ -634,30 +1127,31 @@ def extract_structured_fields(text, lang='en'):
         "bonnummer": bonnummer or not_available,
         "brondocument": brondocument or not_available,
         "case_id": case_id,  # Best available case identifier
-        "status": find_field(r"status[:\s]*(\w+)", text) or "Wegsleepwaardig",
-        "datum_tijd": find_field(r"datum[/\s]tijd[:\s]*([0-9\-\s:]+)", text) or not_available,
-        "medewerker": find_field(r"medewerker[:\s]*([A-Za-z\s\.]+)", text) or not_available,
+        "status": fields.get("status") or "Wegsleepwaardig",
+        "datum_tijd": fields.get("datum_tijd") or not_available,
+        "medewerker": fields.get("medewerker") or not_available,
     }
 
     # Try to extract date/time from common formats
-    date_match = re.search(r"(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*(\d{1,2}:\d{2})?", text)
+    date_match = _search_date(text)
     if date_match:
-        case["datum_tijd"] = f"{date_match.group(1)} {date_match.group(2) or ''}".strip()
+        date_part, time_part = date_match.group(1, 2)
+        case["datum_tijd"] = date_part if time_part is None else f"{date_part} {time_part}"
 
     # Extract location
     location = {
-        "plaats": find_field(r"plaats[:\s]*([A-Za-z\s]+)", text) or "Amsterdam",
-        "stadsdeel": find_field(r"stadsdeel[:\s]*([A-Za-z\s\-]+)", text) or not_available,
-        "buurt": find_field(r"buurt[:\s]*([A-Za-z\s\-]+)", text) or not_available,
-        "straat": find_field(r"straat[:\s]*([A-Za-z\s]+)", text) or not_available,
-        "locatie_nr": find_field(r"(?:locatie\s*nr|huisnummer)[:\s]*(\d+)", text) or "",
+        "plaats": fields.get("plaats") or "Amsterdam",
+        "stadsdeel": fields.get("stadsdeel") or not_available,
+        "buurt": fields.get("buurt") or not_available,
+        "straat": fields.get("straat") or not_available,
+        "locatie_nr": fields.get("locatie_nr") or "",
     }
 
     # Extract violation info - look for E-codes, G-codes, and R-codes (parking signs and road markings)
     # E-codes: E1-E13 (parking signs)
     # G-codes: G1-G9 (pedestrian areas)
     # R-codes: R396i, R397i, R402c, etc. (road marking and parking violations)
-    violation_code_match = re.search(r"\b(E[1-9]|E1[0-3]|G[1-9]|R\d{3}[a-z]?)\b", text, re.IGNORECASE)
+    violation_code_match = _RE_VIOLATION_CODE.search(text)
     violation_code = violation_code_match.group(1).upper() if violation_code_match else None
     original_r_code = violation_code  # Store original R-code for reference
 
@@ -676,46 +1170,42 @@ def extract_structured_fields(text, lang='en'):
 
     # Fallback: If no violation code found, check for yellow line keywords
     if not violation_code:
-        yellow_line_pattern = re.search(r"gele\s+doorgetrokken\s+streep", text, re.IGNORECASE)
+        yellow_line_pattern = _RE_YELLOW_LINE.search(text)
         if yellow_line_pattern:
             violation_code = 'YELLOW_LINE'
             original_r_code = 'R396I'
 
     # Get violation description in selected language (prioritize translation over extracted text)
-    violation_desc_key = f'violation_{violation_code}' if violation_code else None
-    translated_desc = t.get(violation_desc_key) if violation_desc_key else None
-    extracted_desc = find_field(r"overtreding[:\s]*(.+?)(?:\n|$)", text)
+    translated_desc = violation_descs.get(violation_code) if violation_code else None
+    extracted_desc = fields.get("overtreding")
 
     # Use translated description if available for the violation code, otherwise use extracted
-    violation_desc = translated_desc or extracted_desc or t['not_specified']
+    violation_desc = translated_desc or extracted_desc or not_specified
 
     violation = {
-        "code": violation_code or t['not_specified'],
+        "code": violation_code or not_specified,
         "sign": violation_code,
         "description": violation_desc,
-        "toelichting": find_field(r"toelichting[:\s]*(.+?)(?:\n|$)", text) or t['none'],
-        "reden_verwijdering": find_field(r"reden\s*(?:van\s*)?verwijdering[:\s]*(.+?)(?:\n|$)", text) or not_available,
+        "toelichting": fields.get("toelichting") or none_text,
+        "reden_verwijdering": fields.get("reden_verwijdering") or not_available,
     }
 
     # Extract vehicle info
-    kenteken_match = re.search(r"\b([A-Z]{1,3}[-\s]?\d{1,3}[-\s]?[A-Z]{1,3}|\d{1,2}[-\s]?[A-Z]{2,3}[-\s]?\d{1,2})\b", text)
+    kenteken_match = _RE_KENTEKEN.search(text)
     vehicle = {
         "kenteken": kenteken_match.group(1).replace(" ", "-") if kenteken_match else not_available,
-        "merk": find_field(r"merk[:\s]*([A-Za-z]+)", text) or not_available,
-        "model": find_field(r"model[:\s]*([A-Za-z0-9\s]+)", text) or not_available,
-        "kleur": find_field(r"kleur[:\s]*([A-Za-z]+)", text) or not_available,
+        "merk": fields.get("merk") or not_available,
+        "model": fields.get("model") or not_available,
+        "kleur": fields.get("kleur") or not_available,
     }
 
     # Extract officer observation (keep original Dutch text from document)
-    observation_match = re.search(
-        r"(?:redenen\s*van\s*wetenschap|waarneming|observatie)[:\s]*(.+?)(?=\n\n|\Z)",
-        text, re.IGNORECASE | re.DOTALL
-    )
+    observation_match = _RE_OBSERVATION.search(text)
     officer_observation = observation_match.group(1).strip() if observation_match else None
 
     # Extract related registrations
     related = []
-    sleepbon_match = re.search(r"sleepbon[:\s]*([A-Z0-9\-]+)", text, re.IGNORECASE)
+    sleepbon_match = _RE_SLEEPBON.search(text)
     if sleepbon_match:
         related.append({"type": "Sleepbon", "reference": sleepbon_match.group(1)})
 
@@ -755,41 +1245,45 @@ def _generate_sam3_detection_text(sam3_results, lang, t, violation_code):
     lines.append("")
 
     # Calculate average scores from per_image results
-    vehicle_scores = []
-    plate_scores = []
-    sign_scores = []
-
+    # (packed C doubles instead of lists of float objects)
+    buckets = {'vehicle': array('d'), 'license_plate': array('d'), 'traffic_sign': array('d')}
     for img_result in per_image.values():
         for inst in img_result.get('instances', []):
-            if inst['label'] == 'vehicle':
-                vehicle_scores.append(inst['score'])
-            elif inst['label'] == 'license_plate':
-                plate_scores.append(inst['score'])
-            elif inst['label'] == 'traffic_sign':
-                sign_scores.append(inst['score'])
+            scores = buckets.get(inst['label'])
+            if scores is not None:
+                scores.append(inst['score'])
+
+    vehicle_label = t['vehicle']
+    plate_label = t['license_plate']
+    sign_label = t['sign']
+    if violation_code:
+        sign_label = f"{sign_label} {violation_code}"
 
     # Vehicle detection
+    vehicle_scores = buckets['vehicle']
     if vehicle_scores:
         avg_score = sum(vehicle_scores) / len(vehicle_scores)
-        lines.append(f"• {t['vehicle']}: {detected_text} ({confidence_text}: {int(avg_score * 100)}%)")
+        lines.append(f"• {vehicle_label}: {detected_text} ({confidence_text}: {int(avg_score * 100)}%)")
     else:
-        lines.append(f"• {t['vehicle']}: {not_detected_text}")
+        lines.append(f"• {vehicle_label}: {not_detected_text}")
 
     # License plate detection
+    plate_scores = buckets['license_plate']
     if plate_scores:
         avg_score = sum(plate_scores) / len(plate_scores)
-        lines.append(f"• {t['license_plate']}: {detected_text} ({confidence_text}: {int(avg_score * 100)}%)")
+        lines.append(f"• {plate_label}: {detected_text} ({confidence_text}: {int(avg_score * 100)}%)")
     else:
-        lines.append(f"• {t['license_plate']}: {not_detected_text}")
+        lines.append(f"• {plate_label}: {not_detected_text}")
 
     # Traffic sign detection
+    sign_scores = buckets['traffic_sign']
     if sign_scores:
         avg_score = sum(sign_scores) / len(sign_scores)
-        sign_label = f"{t['sign']} {violation_code}" if violation_code else t.get('traffic_sign', 'Traffic Sign')
+        if not violation_code:
+            sign_label = t.get('traffic_sign', 'Traffic Sign')
         lines.append(f"• {sign_label}: {detected_text} ({confidence_text}: {int(avg_score * 100)}%)")
-    else:
-        if violation_code:
-            lines.append(f"• {t['sign']} {violation_code}: {not_detected_text}")
+    elif violation_code:
+        lines.append(f"• {sign_label}: {not_detected_text}")
 
     lines.append("")
     lines.append(t.get('detection_note', 'Detection based on automated image analysis. Manual verification recommended.'))
@@ -797,6 +1291,83 @@ def _generate_sam3_detection_text(sam3_results, lang, t, violation_code):
     return "\n".join(lines)
 
 
+# Original Dutch legal phrases by violation code (direct quotes from legal templates)
+_DUTCH_LEGAL_TEMPLATES = MappingProxyType({
+    "E1": (
+        "Ik zag dat het voertuig geparkeerd stond in een zone waar een parkeerverbod gold, aangeduid door bord E1.",
+        "Ik zag geen geldige ontheffing zichtbaar aanwezig in of aan het voertuig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E2": (
+        "Ik zag dat het voertuig stilstond in een zone waar een verbod stil te staan gold, aangeduid door bord E2.",
+        "Ik zag geen geldige ontheffing zichtbaar aanwezig in of aan het voertuig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E4": (
+        "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid aangeduid door bord E4.",
+        "Het voertuig voldeed niet aan de op het onderbord aangegeven voorwaarden.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E5": (
+        "Ik zag dat het voertuig geparkeerd stond op een taxistandplaats, aangeduid door bord E5.",
+        "Het voertuig betrof geen taxi.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E6": (
+        "Ik zag dat het voertuig geparkeerd stond op een gehandicaptenparkeerplaats.",
+        "Ik zag geen geldige gehandicaptenparkeerkaart zichtbaar aanwezig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E7": (
+        "Ik zag dat het voertuig geparkeerd stond op een laad/los gelegenheid.",
+        "Ik zag geen laad/los activiteiten plaatsvinden.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E8": (
+        "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid bestemd voor specifieke voertuigen, aangeduid door bord E8.",
+        "Het voertuig behoorde niet tot de op het onderbord aangegeven voertuigcategorie.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E9": (
+        "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid bestemd voor vergunninghouders.",
+        "Ik zag geen geldige vergunning zichtbaar aanwezig in of aan het voertuig.",
+        "Ik zag geen laad/los activiteiten plaatsvinden.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "E10": (
+        "Ik zag dat het voertuig geparkeerd stond in een parkeerschijf-zone, aangeduid door bord E10.",
+        "Ik zag geen geldige parkeerschijf zichtbaar aanwezig in het voertuig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "G7": (
+        "Ik zag dat het voertuig geparkeerd stond op het voetpad/voetgangersgebied.",
+        "Het voertuig blokkeerde de doorgang voor voetgangers.",
+    ),
+    "R396I": (
+        "Het betrof een gele doorgetrokken streep.",
+        "Ik zag dat het voertuig stilstond langs een gele doorgetrokken streep.",
+        "Ik zag geen ontheffing zichtbaar aanwezig in het voertuig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+    "YELLOW_LINE": (
+        "Het betrof een gele doorgetrokken streep.",
+        "Ik zag dat het voertuig stilstond langs een gele doorgetrokken streep.",
+        "Ik zag geen ontheffing zichtbaar aanwezig in het voertuig.",
+        "Geen bestuurder was in of rondom het voertuig aanwezig.",
+    ),
+})
+_DEFAULT_DUTCH_PHRASES = (
+    "Ik zag dat het voertuig in overtreding geparkeerd stond.",
+    "Geen bestuurder was in of rondom het voertuig aanwezig.",
+)
+
+# Legal reasoning section body, filled in one format() call
+_LEGAL_CONTENT_TEMPLATE = (
+    "{summary}\n\n{no_driver}\n\n{separator}\n{phrases}\n\n"
+    "{violation_label}: {code} - {description}.{clarification}"
+)
+
+
 def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
     """
     Generate the 7 report sections based on extracted data.
@@ -818,6 +1389,9 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
 
     violation_code = violation.get("code", "")
     not_available = t['not_available']
+    not_specified = t['not_specified']
+    unknown = t['unknown']
+    has_violation_code = violation_code and violation_code != not_specified
 
     # Check if MLLM mode is active
     is_mllm_mode = sam3_results and sam3_results.get('mllm_mode')
@@ -827,9 +1401,9 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
         # Use MLLM-generated image description
         image_desc = sam3_results.get('image_description')
     elif vehicle.get('kenteken') and vehicle.get('kenteken') != not_available:
-        merk = vehicle.get('merk', t['unknown'])
+        merk = vehicle.get('merk', unknown)
         model = vehicle.get('model', '')
-        kleur = vehicle.get('kleur', t['unknown'])
+        kleur = vehicle.get('kleur', unknown)
         kenteken = vehicle.get('kenteken')
         image_desc = f"{t['images_show_vehicle']} ({merk} {model}, {kleur}) {t['with_plate']} {kenteken}. {t['parked_at_location']}"
     else:
@@ -853,6 +1427,9 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
             lines.append(t['detected_objects_mllm'])
         lines.append("")
 
+        detected_text = t['detected']
+        confidence_text = t['confidence']
+
         # Helper to get merged confidence or fallback to OpenAI
         def get_confidence(category, openai_conf):
             if is_parallel_mode and category in merged_results:
@@ -868,30 +1445,28 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
                 return f"  [SAM3: {sam3_pct}% | OpenAI: {openai_pct}%]"
             return None
 
-        # Vehicle
-        if obj_det.get('vehicle', {}).get('detected'):
-            openai_conf = obj_det['vehicle'].get('confidence', 0)
-            conf = get_confidence('vehicle', openai_conf)
-            details = obj_det['vehicle'].get('details', '')
-            lines.append(f"• {t['vehicle']}: {t['detected']} ({t['confidence']}: {conf}%)")
-            conf_detail = format_conf_detail('vehicle')
+        # Helper to add a detected object's line, confidence breakdown and extra detail
+        def add_detection(label, category, entry, extra=None):
+            conf = get_confidence(category, entry.get('confidence', 0))
+            lines.append(f"• {label}: {detected_text} ({confidence_text}: {conf}%)")
+            conf_detail = format_conf_detail(category)
             if conf_detail:
                 lines.append(conf_detail)
-            if details:
-                lines.append(f"  {details}")
+            if extra:
+                lines.append(extra)
+
+        # Vehicle
+        entry = obj_det.get('vehicle', {})
+        if entry.get('detected'):
+            details = entry.get('details', '')
+            add_detection(t['vehicle'], 'vehicle', entry, f"  {details}" if details else None)
 
         # License plate
-        if obj_det.get('license_plate', {}).get('detected'):
-            openai_conf = obj_det['license_plate'].get('confidence', 0)
-            conf = get_confidence('license_plate', openai_conf)
-            value = obj_det['license_plate'].get('value', '')
-            lines.append(f"• {t['license_plate']}: {t['detected']} ({t['confidence']}: {conf}%)")
-            conf_detail = format_conf_detail('license_plate')
-            if conf_detail:
-                lines.append(conf_detail)
-            if value:
-                extracted_label = "Extracted" if lang == 'en' else "Geëxtraheerd"
-                lines.append(f"  {extracted_label}: {value}")
+        entry = obj_det.get('license_plate', {})
+        if entry.get('detected'):
+            value = entry.get('value', '')
+            extracted_label = "Extracted" if lang == 'en' else "Geëxtraheerd"
+            add_detection(t['license_plate'], 'license_plate', entry, f"  {extracted_label}: {value}" if value else None)
 
         # Traffic sign - check for specific sign types first
         sign_category = 'traffic_sign'
@@ -900,69 +1475,58 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
                 sign_category = sign_code
                 break
 
-        if obj_det.get('traffic_sign', {}).get('detected'):
-            openai_conf = obj_det['traffic_sign'].get('confidence', 0)
-            conf = get_confidence(sign_category, openai_conf)
-            sign_type = obj_det['traffic_sign'].get('sign_type', '')
+        entry = obj_det.get('traffic_sign')
+        if entry and entry.get('detected'):
+            sign_type = entry.get('sign_type', '')
             sign_label = f"{t['sign']} {sign_type}" if sign_type else t.get('traffic_sign', 'Traffic Sign')
-            lines.append(f"• {sign_label}: {t['detected']} ({t['confidence']}: {conf}%)")
-            conf_detail = format_conf_detail(sign_category)
-            if conf_detail:
-                lines.append(conf_detail)
+            add_detection(sign_label, sign_category, entry)
 
-        # Parking permit - ABSENCE BASED (not finding = good)
-        permit_in_merged = 'parking_permit' in merged_results
-        if obj_det.get('parking_permit', {}).get('detected'):
-            openai_conf = obj_det['parking_permit'].get('confidence', 0)
-            conf = get_confidence('parking_permit', openai_conf)
-            lines.append(f"• {t['parking_permit']}: {t['detected']} ({t['confidence']}: {conf}%)")
-            conf_detail = format_conf_detail('parking_permit')
-            if conf_detail:
-                lines.append(conf_detail)
-        elif obj_det.get('parking_permit') or permit_in_merged:
-            # Show absence confirmation for parallel mode
-            if is_parallel_mode and permit_in_merged:
-                m = merged_results['parking_permit']
+        # Helper for absence-based objects: the absence line, with the
+        # inverted SAM3 score as absence confidence in parallel mode
+        def add_absence(label, absent_text, category, in_merged):
+            if is_parallel_mode and in_merged:
+                m = merged_results[category]
                 sam3_pct = int(m.get('sam3', 0) * 100)
                 absence_conf = 100 - sam3_pct  # Invert for absence
-                lines.append(f"• {t['parking_permit']}: {t['not_detected']} (Absence: {absence_conf}%)")
+                lines.append(f"• {label}: {absent_text} (Absence: {absence_conf}%)")
                 lines.append(f"  [SAM3: {sam3_pct}% | OpenAI: {int(m.get('openai', 0) * 100)}%]")
             else:
-                lines.append(f"• {t['parking_permit']}: {t['not_detected']}")
+                lines.append(f"• {label}: {absent_text}")
+
+        # Parking permit - ABSENCE BASED (not finding = good)
+        permit_in_merged = 'parking_permit' in merged_results
+        entry = obj_det.get('parking_permit')
+        if entry and entry.get('detected'):
+            add_detection(t['parking_permit'], 'parking_permit', entry)
+        elif entry or permit_in_merged:
+            add_absence(t['parking_permit'], t['not_detected'], 'parking_permit', permit_in_merged)
 
         # Driver presence - ABSENCE BASED (not finding = good for parking)
         person_in_merged = 'person' in merged_results or 'driver_present' in merged_results
         driver_category = 'person' if 'person' in merged_results else 'driver_present'
-
-        if obj_det.get('driver_present', {}).get('detected'):
+        entry = obj_det.get('driver_present')
+        if entry and entry.get('detected'):
             lines.append(f"• {t['driver']}: {t['present']}")
             conf_detail = format_conf_detail(driver_category)
             if conf_detail:
                 lines.append(conf_detail)
-        elif obj_det.get('driver_present') or person_in_merged:
-            # Show absence confirmation for parallel mode
-            if is_parallel_mode and person_in_merged:
-                m = merged_results.get(driver_category, {})
-                sam3_pct = int(m.get('sam3', 0) * 100)
-                absence_conf = 100 - sam3_pct  # Invert for absence
-                lines.append(f"• {t['driver']}: {t['not_present']} (Absence: {absence_conf}%)")
-                lines.append(f"  [SAM3: {sam3_pct}% | OpenAI: {int(m.get('openai', 0) * 100)}%]")
-            else:
-                lines.append(f"• {t['driver']}: {t['not_present']}")
+        elif entry or person_in_merged:
+            add_absence(t['driver'], t['not_present'], driver_category, person_in_merged)
 
         obj_detect = "\n".join(lines)
     elif sam3_results and sam3_results.get('aggregate'):
         obj_detect = _generate_sam3_detection_text(sam3_results, lang, t, violation_code)
     else:
         # Fallback to generic text
-        obj_detect = f"{t['detected_objects']}"
-        if violation_code and violation_code != t['not_specified']:
-            obj_detect += f", {t['traffic_sign']} {violation_code}"
-        obj_detect += f". {t['auto_detection_support']}"
+        sign = (
+            f", {t['traffic_sign']} {violation_code}"
+            if has_violation_code else ""
+        )
+        obj_detect = f"{t['detected_objects']}{sign}. {t['auto_detection_support']}"
 
     # Location content
     if location.get('straat') and location.get('straat') != not_available:
-        loc_content = f"{t['location_label']}: {location.get('straat', t['unknown'])} {location.get('locatie_nr', '')}, {location.get('buurt', '')}, {location.get('stadsdeel', '')}, {location.get('plaats', 'Amsterdam')}.\n{t['date_time_label']}: {case.get('datum_tijd', not_available)}."
+        loc_content = f"{t['location_label']}: {location.get('straat', unknown)} {location.get('locatie_nr', '')}, {location.get('buurt', '')}, {location.get('stadsdeel', '')}, {location.get('plaats', 'Amsterdam')}.\n{t['date_time_label']}: {case.get('datum_tijd', not_available)}."
         loc_source = "document"
     else:
         loc_content = t['location_not_available']
@@ -971,9 +1535,7 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
     # Environmental context - use MLLM data if available
     if is_mllm_mode and sam3_results.get('environmental_context'):
         env_ctx = sam3_results.get('environmental_context', {})
-        env_lines = []
-        env_lines.append(t['environmental_analysis_mllm'])
-        env_lines.append("")
+        env_lines = [t['environmental_analysis_mllm'], ""]
         if env_ctx.get('time_of_day'):
             env_lines.append(f"• {t['time_of_day']}: {env_ctx['time_of_day']}")
         if env_ctx.get('lighting'):
@@ -992,93 +1554,38 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
         env_source = "missing"
 
     # Legal reasoning - include original Dutch legal phrases as quotes, with summary in selected language
-    legal_summary_key = f'legal_{violation_code}_summary' if violation_code and violation_code != t['not_specified'] else 'legal_default_summary'
+    legal_summary_key = f'legal_{violation_code}_summary' if has_violation_code else 'legal_default_summary'
     legal_summary = t.get(legal_summary_key, t['legal_default_summary'])
 
     # Original Dutch legal phrases (these are direct quotes from legal templates)
-    dutch_legal_templates = {
-        "E1": [
-            "Ik zag dat het voertuig geparkeerd stond in een zone waar een parkeerverbod gold, aangeduid door bord E1.",
-            "Ik zag geen geldige ontheffing zichtbaar aanwezig in of aan het voertuig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E2": [
-            "Ik zag dat het voertuig stilstond in een zone waar een verbod stil te staan gold, aangeduid door bord E2.",
-            "Ik zag geen geldige ontheffing zichtbaar aanwezig in of aan het voertuig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E4": [
-            "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid aangeduid door bord E4.",
-            "Het voertuig voldeed niet aan de op het onderbord aangegeven voorwaarden.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E5": [
-            "Ik zag dat het voertuig geparkeerd stond op een taxistandplaats, aangeduid door bord E5.",
-            "Het voertuig betrof geen taxi.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E6": [
-            "Ik zag dat het voertuig geparkeerd stond op een gehandicaptenparkeerplaats.",
-            "Ik zag geen geldige gehandicaptenparkeerkaart zichtbaar aanwezig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E7": [
-            "Ik zag dat het voertuig geparkeerd stond op een laad/los gelegenheid.",
-            "Ik zag geen laad/los activiteiten plaatsvinden.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E8": [
-            "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid bestemd voor specifieke voertuigen, aangeduid door bord E8.",
-            "Het voertuig behoorde niet tot de op het onderbord aangegeven voertuigcategorie.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E9": [
-            "Ik zag dat het voertuig geparkeerd stond op een parkeergelegenheid bestemd voor vergunninghouders.",
-            "Ik zag geen geldige vergunning zichtbaar aanwezig in of aan het voertuig.",
-            "Ik zag geen laad/los activiteiten plaatsvinden.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "E10": [
-            "Ik zag dat het voertuig geparkeerd stond in een parkeerschijf-zone, aangeduid door bord E10.",
-            "Ik zag geen geldige parkeerschijf zichtbaar aanwezig in het voertuig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "G7": [
-            "Ik zag dat het voertuig geparkeerd stond op het voetpad/voetgangersgebied.",
-            "Het voertuig blokkeerde de doorgang voor voetgangers.",
-        ],
-        "R396I": [
-            "Het betrof een gele doorgetrokken streep.",
-            "Ik zag dat het voertuig stilstond langs een gele doorgetrokken streep.",
-            "Ik zag geen ontheffing zichtbaar aanwezig in het voertuig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-        "YELLOW_LINE": [
-            "Het betrof een gele doorgetrokken streep.",
-            "Ik zag dat het voertuig stilstond langs een gele doorgetrokken streep.",
-            "Ik zag geen ontheffing zichtbaar aanwezig in het voertuig.",
-            "Geen bestuurder was in of rondom het voertuig aanwezig.",
-        ],
-    }
-
-    dutch_phrases = dutch_legal_templates.get(violation_code, [
-        "Ik zag dat het voertuig in overtreding geparkeerd stond.",
-        "Geen bestuurder was in of rondom het voertuig aanwezig.",
-    ])
+    dutch_phrases = _DUTCH_LEGAL_TEMPLATES.get(violation_code, _DEFAULT_DUTCH_PHRASES)
 
     # Build legal content with quotes and summary
-    legal_content = legal_summary + "\n\n" + t['no_driver_present']
-    legal_content += f"\n\n{t['from_document_separator']}\n"
-    legal_content += "\n".join(dutch_phrases)
-    legal_content += f"\n\n{t['violation_label']}: {violation.get('code', t['not_specified'])} - {violation.get('description', t['no_description'])}."
-    if violation.get('toelichting') and violation.get('toelichting') != t['none']:
-        legal_content += f"\n{t['clarification_label']}: {violation.get('toelichting')}"
+    toelichting = violation.get('toelichting')
+    legal_content = _LEGAL_CONTENT_TEMPLATE.format(
+        summary=legal_summary,
+        no_driver=t['no_driver_present'],
+        separator=t['from_document_separator'],
+        phrases="\n".join(dutch_phrases),
+        violation_label=t['violation_label'],
+        code=violation.get('code', not_specified),
+        description=violation.get('description', t['no_description']),
+        clarification=(
+            f"\n{t['clarification_label']}: {toelichting}" if toelichting and toelichting != t['none'] else ""
+        ),
+    )
 
     # Supporting evidence
     obs_status = t['available'] if observation else not_available
-    evidence_content = f"{t['supporting_evidence_label']}:\n- {t['num_evidence_photos']}: {len(images)}\n- {t['vehicle_data']}: {vehicle.get('kenteken', not_available)}\n- {t['officer_obs_status']}: {obs_status}"
+    evidence_lines = [
+        f"{t['supporting_evidence_label']}:",
+        f"- {t['num_evidence_photos']}: {len(images)}",
+        f"- {t['vehicle_data']}: {vehicle.get('kenteken', not_available)}",
+        f"- {t['officer_obs_status']}: {obs_status}",
+    ]
     if observation:
-        evidence_content += f"\n\n{t['reasons_knowledge']}:\n{observation}"
+        evidence_lines += ["", f"{t['reasons_knowledge']}:", observation]
+    evidence_content = "\n".join(evidence_lines)
 
     sections = [
         {
@@ -1136,38 +1643,64 @@ def generate_report_sections(doc_summary, images, lang='en', sam3_results=None):
     return sections
 
 
-def calculate_confidence_scores(doc_summary, images):
-    """Calculate confidence scores based on available data."""
+# Placeholder texts that extract_structured_fields puts in missing fields
+_RE_NOT_AVAILABLE = re.compile(r"beschikbaar|available", re.IGNORECASE)
+_RE_NOT_SPECIFIED = re.compile(r"gespecificeerd|specified", re.IGNORECASE)
 
-    scores = {
-        "object_detection": 0.0,
-        "text_recognition": 0.0,
-        "legal_reasoning": 0.0
-    }
 
-    # Object detection confidence based on image availability
-    if images:
-        scores["object_detection"] = min(0.95, 0.7 + (len(images) * 0.02))
+def _has_value(value, placeholder):
+    """True if value is set and is not a 'not available'/'not specified' placeholder."""
+    return bool(value) and not placeholder.search(str(value))
+
 
+def _score_core(n_images, has_plate, has_any, has_code, has_obs):
+    """
+    Numeric core of calculate_confidence_scores.
+
+    Takes only ints and bools so it can be vectorized or compiled (e.g. with
+    numba) for bulk re-scoring without touching the string checks.
+
+    Returns:
+        Tuple of (object_detection, text_recognition, legal_reasoning)
+    """
+    object_detection = min(0.95, 0.7 + (n_images * 0.02)) if n_images else 0.0
+
+    if has_plate:
+        text_recognition = 0.88
+    elif has_any:
+        text_recognition = 0.65
+    else:
+        text_recognition = 0.0
+
+    if has_code:
+        legal_reasoning = 0.86
+    elif has_obs:
+        legal_reasoning = 0.72
+    else:
+        legal_reasoning = 0.45
+
+    return object_detection, text_recognition, legal_reasoning
+
+
+def calculate_confidence_scores(doc_summary, images):
+    """Calculate confidence scores based on available data."""
     # Text recognition based on extracted fields
     vehicle = doc_summary.get("vehicle", {})
-    kenteken = vehicle.get("kenteken", "")
-    if kenteken and "beschikbaar" not in kenteken.lower() and "available" not in kenteken.lower():
-        scores["text_recognition"] = 0.88
-    elif any(v and "beschikbaar" not in str(v).lower() and "available" not in str(v).lower() for v in vehicle.values()):
-        scores["text_recognition"] = 0.65
+    has_plate = _has_value(vehicle.get("kenteken", ""), _RE_NOT_AVAILABLE)
+    has_any = not has_plate and any(_has_value(v, _RE_NOT_AVAILABLE) for v in vehicle.values())
 
     # Legal reasoning based on violation code availability
-    violation = doc_summary.get("violation", {})
-    code = violation.get("code", "")
-    if code and "gespecificeerd" not in code.lower() and "specified" not in code.lower():
-        scores["legal_reasoning"] = 0.86
-    elif doc_summary.get("officer_observation"):
-        scores["legal_reasoning"] = 0.72
-    else:
-        scores["legal_reasoning"] = 0.45
+    has_code = _has_value(doc_summary.get("violation", {}).get("code", ""), _RE_NOT_SPECIFIED)
+    has_obs = not has_code and bool(doc_summary.get("officer_observation"))
 
-    return scores
+    object_detection, text_recognition, legal_reasoning = _score_core(
+        len(images) if images else 0, has_plate, has_any, has_code, has_obs
+    )
+    return {
+        "object_detection": object_detection,
+        "text_recognition": text_recognition,
+        "legal_reasoning": legal_reasoning
+    }
 
 
 def generate_mock_data(doc_summary, extracted_images, lang='en'):
@@ -1388,14 +1921,28 @@ Pursuant to Article 25 RVV 1990, it is prohibited to park a vehicle in a permit
     }
 
 
+# The upload page depends only on the language, so it is rendered once per
+# language and served from memory (re-rendered every time in debug mode)
+_INDEX_PAGES = {}
+
+# Compile the report template at startup instead of on the first /predict
+app.jinja_env.get_template('result.html')
+
+
 @app.route('/')
 def index():
     # Default to English, but check if language preference is set
     lang = request.args.get('lang', 'en')
     if lang not in ['en', 'nl']:
         lang = 'en'
-    t = get_translations(lang)
-    return render_template('index.html', t=t, lang=lang)
+
+    page = None if app.debug else _INDEX_PAGES.get(lang)
+    if page is None:
+        t = get_translations(lang)
+        page = render_template('index.html', t=t, lang=lang)
+        if not app.debug:
+            _INDEX_PAGES[lang] = page
+    return page
 
 
 @app.route('/predict', methods=['POST'])
@@ -1420,11 +1967,79 @@ def predict():
     if model_type not in ['sam', 'mllm', 'openai', 'openai_sam', 'mock']:
         model_type = 'mllm'
 
+    filename = secure_filename(f.filename)
+
+    # Renamed non-PDF files would otherwise be saved and fail deep inside fitz
+    if is_pdf(filename) and not is_pdf_stream(f.stream):
+        return jsonify({'error': 'file is not a valid PDF'}), 400
+
+    # Store uploads by content hash: identical uploads are saved once, and
+    # concurrent uploads sharing a filename cannot overwrite each other
+    upload_digest = _hash_upload(f.stream)
+    stored_name = upload_digest + os.path.splitext(filename)[1].lower()
+    path = os.path.join(app.config['UPLOAD_FOLDER'], stored_name)
+    if not os.path.exists(path):
+        _save_upload(f.stream, path)
+
+    if ASYNC_ANALYSIS:
+        job_id = uuid.uuid4().hex
+        steps = []
+        future = analysis_executor.submit(_analyze_upload, path, filename, upload_digest, lang, model_type,
+                                          steps.append)
+        with _analysis_jobs_lock:
+            _analysis_jobs[job_id] = (lang, future, steps)
+            while len(_analysis_jobs) > ANALYSIS_JOB_HISTORY:
+                _analysis_jobs.popitem(last=False)
+        return redirect(url_for('analysis_result', job_id=job_id), code=303)
+
+    try:
+        context = _analyze_upload(path, filename, upload_digest, lang, model_type)
+    except UploadAnalysisError as e:
+        return jsonify({'error': str(e)}), e.status
+    return render_template('result.html', **context)
+
+
+class UploadAnalysisError(Exception):
+    """Analysis failure reported to the client as a JSON error with an HTTP status."""
+
+    def __init__(self, message, status=500):
+        super().__init__(message)
+        self.status = status
+
+
+def _analyze_upload(path, filename, upload_digest, lang, model_type, progress=None):
+    """
+    Run the extraction and analysis pipeline for a saved upload.
+
+    Needs no request context, so it runs on the request thread or as a
+    queued job on analysis_executor.
+
+    Args:
+        path: Path of the stored upload
+        filename: Sanitized original filename (shown in the report)
+        upload_digest: Content digest of the upload
+        lang: Language code (en/nl)
+        model_type: Analysis model (sam, mllm, openai, openai_sam, mock)
+        progress: Optional callback receiving each pipeline step as it
+            starts ('extract', 'analyze', 'report')
+
+    Returns:
+        Template context for result.html
+
+    Raises:
+        UploadAnalysisError: If the upload cannot be processed
+    """
     t = get_translations(lang)
+    upload_is_pdf = is_pdf(filename)
+    data_folder = app.config['DATA_FOLDER']
+    if progress:
+        progress('extract')
 
-    filename = secure_filename(f.filename)
-    path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    f.save(path)
+    cached = _load_case(upload_digest, lang, model_type) if CASE_CACHE else None
+    if cached is not None:
+        logger.info(f"Reusing cached {model_type} analysis for upload {upload_digest}")
+        cached.update(filename=filename, t=t)
+        return cached
 
     # Initialize data structures
     extracted_images = []
@@ -1439,26 +2054,31 @@ def predict():
     }
 
     # Check if PDF - extract images and text
-    if is_pdf(filename):
+    if upload_is_pdf:
         try:
             from pathlib import Path
 
-            # Extract text for structured fields
-            pdf_text = extract_pdf_text(path)
-            doc_summary = extract_structured_fields(pdf_text, lang)
+            out_dir = Path(data_folder)
 
-            # Extract images
-            doc = fitz.open(path)
-            pdf_stem = Path(filename).stem
-            pdf_stem = "".join(c if c.isalnum() or c in "-_" else "_" for c in pdf_stem)
-            out_dir = Path(app.config['DATA_FOLDER'])
+            # Re-uploads of an already parsed PDF reuse its text and images
+            cached = _load_pdf_extraction(upload_digest)
+            if cached is not None:
+                pdf_text, all_images = cached
+            else:
+                pdf_stem = sanitize_stem(Path(filename).stem)
 
-            all_images = []
-            for page_num in range(len(doc)):
-                images, _ = extract_embedded_images(doc, page_num, pdf_stem, out_dir, min_size=200)
-                all_images.extend(images)
+                # One open document (one xref parse) serves the text and the
+                # first range of pages for image extraction
+                with fitz.open(path, filetype="pdf") as doc:
+                    # Extract text for structured fields
+                    pdf_text = extract_pdf_text(doc)
 
-            doc.close()
+                    # Extract images
+                    all_images = extract_pdf_images(doc, path, pdf_stem, out_dir)
+
+                _store_pdf_extraction(upload_digest, pdf_text, all_images)
+
+            doc_summary = extract_structured_fields(pdf_text, lang)
 
             # Write manifest
             write_manifest(out_dir, Path(path), all_images, [])
@@ -1466,7 +2086,10 @@ def predict():
             images_metadata = all_images
 
         except Exception as e:
-            return jsonify({'error': f'PDF extraction failed: {str(e)}'}), 500
+            raise UploadAnalysisError(f'PDF extraction failed: {str(e)}')
+
+    if progress:
+        progress('analyze')
 
     # Run SAM3 analysis on extracted images (only when SAM model is selected)
     sam3_results = None
@@ -1475,13 +2098,12 @@ def predict():
     if model_type == 'sam' and extracted_images:
         try:
             image_paths = [
-                os.path.join(app.config['DATA_FOLDER'], img)
+                os.path.join(data_folder, img)
                 for img in extracted_images
             ]
-            sam3_results = analyze_evidence_images(
-                image_paths,
-                output_dir=app.config['DERIVED_FOLDER'],
-                mock_mode=SAM_MOCK_MODE  # Configured via SAM_MOCK_MODE env var
+            # Queued with concurrent requests; analyzed by the shared sam3_analyzer
+            sam3_results = sam3_request_batcher.submit(image_paths).result(
+                timeout=SAM_REQUEST_TIMEOUT
             )
 
             # Get detected items for the first image (default selection)
@@ -1510,7 +2132,7 @@ def predict():
         # MLLM analysis using Claude Vision
         try:
             image_paths = [
-                os.path.join(app.config['DATA_FOLDER'], img)
+                os.path.join(data_folder, img)
                 for img in extracted_images
             ]
 
@@ -1519,7 +2141,8 @@ def predict():
                 image_paths=image_paths,
                 doc_summary=doc_summary,
                 lang=lang,
-                max_images=10
+                max_images=10,
+                service=claude_vision_service
             )
 
             # Extract results for template
@@ -1552,7 +2175,7 @@ def predict():
         # OpenAI MLLM analysis using GPT-4o Vision
         try:
             image_paths = [
-                os.path.join(app.config['DATA_FOLDER'], img)
+                os.path.join(data_folder, img)
                 for img in extracted_images
             ]
 
@@ -1561,7 +2184,8 @@ def predict():
                 image_paths=image_paths,
                 doc_summary=doc_summary,
                 lang=lang,
-                max_images=10
+                max_images=10,
+                service=openai_vision_service
             )
 
             # Extract results for template
@@ -1599,7 +2223,7 @@ def predict():
 
         try:
             image_paths = [
-                os.path.join(app.config['DATA_FOLDER'], img)
+                os.path.join(data_folder, img)
                 for img in extracted_images
             ]
 
@@ -1639,7 +2263,8 @@ def predict():
                     image_paths,
                     doc_summary,
                     lang,
-                    10  # max_images
+                    10,  # max_images
+                    service=openai_vision_service
                 )
 
                 # Collect results with timeout handling
@@ -1883,6 +2508,9 @@ def predict():
         mock_confidence_scores = mock_data['confidence_scores']
         logger.info(f"Mock data generated: recommendation={sam3_results.get('recommendation', {}).get('action')}")
 
+    if progress:
+        progress('report')
+
     # Generate report sections and confidence scores (now with SAM3/MLLM/Mock)
     report_sections = generate_report_sections(doc_summary, extracted_images, lang, sam3_results)
 
@@ -1903,9 +2531,9 @@ def predict():
     elif sam3_results and sam3_results.get('per_image'):
         # SAM mode - use SAM3 analyzer
         kenteken = doc_summary.get('vehicle', {}).get('kenteken', '')
-        has_plate = kenteken and 'beschikbaar' not in kenteken.lower() and 'available' not in kenteken.lower()
+        has_plate = _has_value(kenteken, _RE_NOT_AVAILABLE)
         violation_code = doc_summary.get('violation', {}).get('code', '')
-        has_code = violation_code and 'gespecificeerd' not in violation_code.lower() and 'specified' not in violation_code.lower()
+        has_code = _has_value(violation_code, _RE_NOT_SPECIFIED)
         confidence_scores = sam3_analyzer.calculate_confidence_scores(
             sam3_results.get('per_image', {}),
             has_plate_text=has_plate,
@@ -1918,43 +2546,150 @@ def predict():
     # Add evidence images to doc_summary
     doc_summary["evidence_images"] = images_metadata
 
-    return render_template('result.html',
-                          filename=filename,
-                          is_pdf=is_pdf(filename),
-                          extracted_images=extracted_images,
-                          images_metadata=images_metadata,
-                          doc_summary=doc_summary,
-                          report_sections=report_sections,
-                          confidence_scores=confidence_scores,
-                          sam3_results=sam3_results,
-                          detected_items_ui=detected_items_ui,
-                          model_type=model_type,
-                          generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
-                          lang=lang,
-                          t=t)
+    context = dict(filename=filename,
+                   is_pdf=upload_is_pdf,
+                   extracted_images=extracted_images,
+                   images_metadata=images_metadata,
+                   doc_summary=doc_summary,
+                   report_sections=report_sections,
+                   confidence_scores=confidence_scores,
+                   sam3_results=sam3_results,
+                   detected_items_ui=detected_items_ui,
+                   model_type=model_type,
+                   generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                   lang=lang,
+                   t=t)
+
+    # Only cache reports the selected model actually contributed to; a failed
+    # or skipped analysis (sam3_results is None) is retried on re-upload
+    if CASE_CACHE and sam3_results:
+        _store_case(upload_digest, lang, model_type, context)
+    return context
+
+
+def _get_analysis_job(job_id):
+    with _analysis_jobs_lock:
+        job = _analysis_jobs.get(job_id)
+    if job is None:
+        abort(404)
+    return job
+
+
+@app.route('/status/<job_id>')
+def analysis_status(job_id):
+    """Report whether a queued analysis is pending, done or failed."""
+    _, future, _ = _get_analysis_job(job_id)
+    if not future.done():
+        return jsonify({'status': 'pending'})
+    return jsonify({'status': 'error' if future.exception() else 'done'})
+
+
+@app.route('/events/<job_id>')
+def analysis_events(job_id):
+    """
+    Stream the progress of a queued analysis as Server-Sent Events.
+
+    Sends a 'progress' event for each pipeline step as it starts, then a
+    'done' event whose data is the URL of the rendered result.
+    """
+    _, future, steps = _get_analysis_job(job_id)
+    result_url = url_for('analysis_result', job_id=job_id)
+
+    def generate():
+        sent = 0
+        while True:
+            finished = future.done()
+            # steps only grows (list.append from the worker thread), so
+            # everything past `sent` is new
+            for step in steps[sent:]:
+                yield f"event: progress\ndata: {json.dumps({'step': step})}\n\n"
+                sent += 1
+            if finished:
+                break
+            wait([future], timeout=ANALYSIS_EVENT_INTERVAL)
+        yield f"event: done\ndata: {result_url}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/result/<job_id>')
+def analysis_result(job_id):
+    """Render a queued analysis, or a self-refreshing progress page while it runs."""
+    lang, future, _ = _get_analysis_job(job_id)
+    if not future.done():
+        return render_template('processing.html', t=get_translations(lang), lang=lang, job_id=job_id,
+                               refresh_seconds=ANALYSIS_POLL_SECONDS)
+    try:
+        context = future.result()
+    except UploadAnalysisError as e:
+        return jsonify({'error': str(e)}), e.status
+    return render_template('result.html', **context)
+
+
+def _send_file(folder_key, filename, max_age=None, immutable=False):
+    """
+    Serve a file from a configured folder, delegating to the proxy if enabled.
+
+    Args:
+        folder_key: app.config key of the folder to serve from
+        filename: Path of the file relative to that folder
+        max_age: Cache-Control max-age in seconds (None leaves caching to
+            conditional requests only)
+        immutable: Mark the response as never changing at this URL
+
+    Returns:
+        The file response (ETag / Last-Modified make repeat requests 304s)
+    """
+    folder = app.config[folder_key]
+    if SENDFILE_MODE not in ('x-accel', 'x-sendfile') or app.debug:
+        response = send_from_directory(folder, filename, max_age=max_age)
+        if immutable:
+            response.cache_control.immutable = True
+        return response
+
+    path = safe_join(folder, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+    if SENDFILE_MODE == 'x-accel':
+        # Internal location mirrors the app directory layout under X_ACCEL_PREFIX
+        relative = os.path.relpath(path, os.path.dirname(os.path.abspath(__file__)))
+        response.headers['X-Accel-Redirect'] = f"{X_ACCEL_PREFIX}/{relative.replace(os.sep, '/')}"
+    else:
+        response.headers['X-Sendfile'] = os.path.abspath(path)
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        if immutable:
+            response.cache_control.immutable = True
+    return response
 
 
 @app.route('/uploads/<path:filename>')
 def uploaded_file(filename):
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return _send_file('UPLOAD_FOLDER', filename, max_age=UPLOAD_CACHE_MAX_AGE, immutable=True)
 
 
 @app.route('/data/<path:filename>')
 def data_file(filename):
-    return send_from_directory(app.config['DATA_FOLDER'], filename)
+    return _send_file('DATA_FOLDER', filename, max_age=DATA_CACHE_MAX_AGE)
 
 
 @app.route('/data/derived/<path:filename>')
 def derived_file(filename):
     """Serve SAM3 derived files (crops, overlays)."""
-    return send_from_directory(app.config['DERIVED_FOLDER'], filename)
+    return _send_file('DERIVED_FOLDER', filename, max_age=DATA_CACHE_MAX_AGE)
 
 
 @app.route('/api/export-json', methods=['POST'])
 def export_json():
     """Export the document summary and report as JSON."""
-    data = request.get_json()
-    return jsonify(data)
+    # Parse only to validate (bad JSON -> 400), then echo the received bytes
+    # instead of serializing the whole report a second time
+    request.get_json()
+    return Response(request.get_data(), mimetype='application/json')
 
 
 if __name__ == '__main__':
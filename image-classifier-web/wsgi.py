@@ -0,0 +1,22 @@
+"""
+WSGI entry point for running the app under a production server.
+
+Example:
+    gunicorn -w $(nproc) -k gthread --threads 4 --preload wsgi:application
+
+--preload imports the app (and loads the SAM model) once in the master
+process; forked workers share it copy-on-write. CUDA cannot be used after a
+fork, so with SAM on GPU run a single worker and scale with --threads instead:
+    gunicorn -w 1 -k gthread --threads 8 wsgi:application
+
+WARMUP=true opens the Claude API connection at boot; only use it without
+--preload, so each worker opens its own.
+
+ASYNC_ANALYSIS=true keeps queued analysis jobs in the worker process that
+accepted the upload, so use it with a single worker (-w 1) and --threads.
+Each open progress page holds one thread for its /events stream.
+"""
+
+from server import app
+
+application = app